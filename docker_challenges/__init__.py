@@ -1,22 +1,31 @@
+import functools
+import hashlib
 import logging
 import os
+import shutil
 import tempfile
-import traceback
-from pathlib import Path
+import threading
+import time
+from operator import itemgetter
+from typing import Any, Callable
 
 from CTFd.api import CTFd_API_v1
+from CTFd.cache import cache
 from CTFd.models import Teams, Users, db
 from CTFd.plugins import register_plugin_assets_directory
 from CTFd.plugins.challenges import CHALLENGE_CLASSES
 from CTFd.utils.config import is_teams_mode
 from CTFd.utils.decorators import admins_only
-from flask import Blueprint, render_template, request
+from flask import Blueprint, current_app, g, make_response, render_template, request
+from sqlalchemy import BigInteger, Integer, cast, func, inspect, text
 from sqlalchemy.exc import InternalError
 
 from .api import (
     active_docker_namespace,
+    cleanup_stale_containers,
     container_namespace,
     docker_namespace,
+    get_docker_config,
     image_ports_namespace,
     kill_container,
     secret_namespace,
@@ -31,30 +40,179 @@ __all__ = [
     "kill_container",
     "secret_namespace",
 ]
-from .functions.general import get_docker_info, get_repositories, get_secrets, is_swarm_mode
+from .constants import (
+    ADMIN_LOOKUP_IDLE_SECONDS,
+    CERT_UPLOAD_CHUNK_SIZE,
+    DOCKER_LOOKUP_REFRESH_INTERVAL_SECONDS,
+    STALE_CLEANUP_INTERVAL_SECONDS,
+)
+from .functions.general import (
+    cached_lookup,
+    clear_lookup_cache,
+    close_docker_connections,
+    get_docker_info,
+    get_repositories,
+    get_secrets,
+    is_swarm_mode,
+)
 from .models.container import DockerChallengeType
-from .models.models import DockerChallengeTracker, DockerConfig, DockerConfigForm
+from .models.models import (
+    DockerChallenge,
+    DockerChallengeTracker,
+    DockerConfig,
+    DockerConfigForm,
+    DockerServiceChallenge,
+)
 from .models.service import DockerServiceChallengeType
 
+# Docker API lookups rendered by the admin pages, kept warm by a background refresher.
+# Keys are shared with the API views that cache the same Docker calls (e.g. "secret_list").
+_ADMIN_LOOKUPS: dict[str, Callable[[DockerConfig], Any]] = {
+    "repositories": get_repositories,
+    "docker_info": get_docker_info,
+    "swarm_mode": is_swarm_mode,
+    "secret_list": get_secrets,
+}
+# Last time (time.monotonic) each admin lookup was read in this process
+_admin_lookup_reads: dict[str, float] = {}
+_background_workers_lock = threading.Lock()
+# Shared cache key claimed by the worker process that runs the current stale sweep
+_STALE_SWEEP_CLAIM_KEY = "docker_challenges:stale_sweep"
+
+
+def _admin_lookup(docker: DockerConfig, name: str, force: bool = False) -> Any:
+    """Return an admin page Docker lookup, served from the lookup cache when fresh."""
+    fetch = _ADMIN_LOOKUPS[name]
+    if not force:
+        _admin_lookup_reads[name] = time.monotonic()
+    return cached_lookup(docker, name, lambda: fetch(docker), force=force)
+
+
+def _refresh_active_admin_lookups(app) -> None:
+    """Re-fetch the admin lookups read within ADMIN_LOOKUP_IDLE_SECONDS, each independently."""
+    cutoff = time.monotonic() - ADMIN_LOOKUP_IDLE_SECONDS
+    active = [name for name, read_at in _admin_lookup_reads.items() if read_at >= cutoff]
+    if not active:
+        return
+    with app.app_context():
+        docker = get_docker_config()
+        if not (docker and docker.hostname):
+            return
+        for name in active:
+            try:
+                _admin_lookup(docker, name, force=True)
+            except Exception:
+                logging.exception("Background refresh of Docker lookup %s failed", name)
+
+
+def _refresh_admin_lookups(app) -> None:
+    """Periodically re-fetch admin page lookups in use so requests never wait on Docker."""
+    while True:
+        try:
+            _refresh_active_admin_lookups(app)
+        except Exception:
+            logging.exception("Background refresh of Docker lookups failed")
+        time.sleep(DOCKER_LOOKUP_REFRESH_INTERVAL_SECONDS)
+
+
+def _claim_stale_sweep() -> bool:
+    """Claim this interval's stale sweep so only one worker process runs it.
+
+    cache.add() only succeeds when the key is absent, so with a shared cache (Redis)
+    the first worker to wake up wins. The claim expires slightly before the next
+    interval so that worker can claim it again.
+    """
+    return bool(
+        cache.add(_STALE_SWEEP_CLAIM_KEY, True, timeout=STALE_CLEANUP_INTERVAL_SECONDS - 10)
+    )
+
+
+def _run_stale_sweep(app) -> None:
+    """Remove stale containers for every owner, unless another worker claimed this interval."""
+    with app.app_context():
+        if not _claim_stale_sweep():
+            return
+        docker = get_docker_config()
+        if docker and docker.hostname:
+            cleanup_stale_containers(docker)
+
+
+def _sweep_stale_containers(app) -> None:
+    """Periodically run the stale container sweep, off the request path."""
+    while True:
+        time.sleep(STALE_CLEANUP_INTERVAL_SECONDS)
+        try:
+            _run_stale_sweep(app)
+        except Exception:
+            logging.exception("Background stale container cleanup failed")
+
+
+def _start_background_worker(app, target: Callable[[Any], None], name: str) -> None:
+    """Start a daemon worker thread for app unless one is already alive in this process.
+
+    Threads are tracked on app.extensions per process id: a gunicorn --preload fork copies
+    the registry but not the threads, so each worker process starts its own.
+    """
+    workers = app.extensions.setdefault("docker_challenges.workers", {})
+    key = (os.getpid(), name)
+    thread = workers.get(key)
+    if thread is not None and thread.is_alive():
+        return
+    with _background_workers_lock:
+        thread = workers.get(key)
+        if thread is not None and thread.is_alive():
+            return
+        thread = threading.Thread(target=target, args=(app,), name=name, daemon=True)
+        workers[key] = thread
+    thread.start()
+
+
+def _ensure_background_workers() -> None:
+    """Start (or restart) this process's background workers; cheap once they are running."""
+    app = current_app._get_current_object()
+    _start_background_worker(app, _sweep_stale_containers, "docker-stale-cleanup")
+    _start_background_worker(app, _refresh_admin_lookups, "docker-lookup-refresher")
+
+
+@functools.lru_cache(maxsize=4)
+def _repository_choices(repos: tuple[str, ...]) -> list[tuple[str, str]]:
+    """Build (value, label) select choices, shared across renders of the same repo list."""
+    return list(zip(repos, repos))
+
+
+def _safe_unlink(path: str) -> None:
+    """Delete a certificate file, treating an already missing file as success."""
+    try:
+        os.unlink(path)
+        logging.debug("Cleaned up certificate file: %s", path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning("Failed to delete certificate file %s: %s", path, e)
+
+
+def _clear_cert(config: DockerConfig, attr: str) -> None:
+    """Delete a stored certificate file and clear its database reference."""
+    cert_path = getattr(config, attr, None)
+    if cert_path:
+        _safe_unlink(cert_path)
+    setattr(config, attr, None)
+
 
 def __handle_file_upload(file_key: str, b_obj: DockerConfig, attr_name: str):
     if file_key not in request.files:
         return
 
     try:
-        file_content = request.files[file_key].stream.read()
-        if len(file_content) == 0:
+        # Measure the upload without buffering it into memory
+        stream = request.files[file_key].stream
+        stream.seek(0, os.SEEK_END)
+        if stream.tell() == 0:
             # No new file uploaded — preserve existing certificate
             return
+        stream.seek(0)
 
-        # Clean up old certificate file if it exists
         old_cert_path = getattr(b_obj, attr_name, None)
-        if old_cert_path and Path(old_cert_path).exists():
-            try:
-                os.unlink(old_cert_path)
-                logging.debug("Cleaned up old certificate file: %s", old_cert_path)
-            except OSError as e:
-                logging.warning("Failed to delete old certificate file %s: %s", old_cert_path, e)
 
         # Use secure temp directory with restrictive permissions and .pem suffix
         with tempfile.NamedTemporaryFile(
@@ -62,237 +220,352 @@ def __handle_file_upload(file_key: str, b_obj: DockerConfig, attr_name: str):
             suffix=".pem",
             delete=False,
             prefix=f"docker_{attr_name}_",
+            dir=current_app.config.get("DOCKER_PLUGIN_CERT_DIR"),
         ) as tmp_file:
-            tmp_file.write(file_content)
+            shutil.copyfileobj(stream, tmp_file, length=CERT_UPLOAD_CHUNK_SIZE)
             tmp_file.flush()
             # Set restrictive permissions (owner read/write only)
             os.chmod(tmp_file.name, 0o600)
             setattr(b_obj, attr_name, tmp_file.name)
+
+        # Only remove the old certificate once its replacement is safely on disk
+        if old_cert_path:
+            _safe_unlink(old_cert_path)
     except Exception as err:
         logging.error(err)
 
 
-def define_docker_admin(app):
-    admin_docker_config = Blueprint(
-        "admin_docker_config",
-        __name__,
-        template_folder="templates",
-        static_folder="assets",
-    )
+admin_docker_config = Blueprint(
+    "admin_docker_config",
+    __name__,
+    template_folder="templates",
+    static_folder="assets",
+)
+
 
-    def _validate_tls_certificates(docker: DockerConfig) -> None:
-        """Validate that TLS certificate files exist, disable TLS if missing."""
-        if not (docker and docker.tls_enabled):
+def _validate_tls_certificates(docker: DockerConfig) -> None:
+    """Validate that TLS certificate files exist, disable TLS if missing."""
+    if not (docker and docker.tls_enabled):
+        return
+
+    for key in ("ca_cert", "client_cert", "client_key"):
+        file_name = getattr(docker, key)
+        if file_name and not os.path.exists(file_name):
+            logging.warning("TLS certificate file missing: %s=%s. Disabling TLS.", key, file_name)
+            docker.tls_enabled = False
             return
 
-        for key in ["ca_cert", "client_cert", "client_key"]:
-            file_name = getattr(docker, key)
-            if file_name and not Path(file_name).exists():
-                logging.warning(
-                    "TLS certificate file missing: %s=%s. Disabling TLS.", key, file_name
-                )
-                docker.tls_enabled = False
-                return
-
-    def _get_or_create_config() -> DockerConfig:
-        """Get existing DockerConfig or create a new one."""
-        docker = DockerConfig.query.filter_by(id=1).first()
-        if not docker:
-            logging.info("No docker config was found, setting empty one.")
-            docker = DockerConfig()
-            db.session.add(docker)
-            db.session.commit()
-            docker = DockerConfig.query.filter_by(id=1).first()
-        return docker
-
-    def _process_docker_config_form(config: DockerConfig) -> None:
-        """Process POST form data to update Docker configuration."""
-        __handle_file_upload("ca_cert", config, "ca_cert")
-        __handle_file_upload("client_cert", config, "client_cert")
-        __handle_file_upload("client_key", config, "client_key")
-
-        config.hostname = request.form["hostname"]
-
-        # Handle TLS enablement
-        config.tls_enabled = False
-        if "tls_enabled" in request.form:
-            config.tls_enabled = request.form["tls_enabled"] == "True"
-
-        # Clear TLS certs if TLS is disabled
-        if not config.tls_enabled:
-            # Clean up certificate files before clearing database references
-            for cert_attr in ["ca_cert", "client_cert", "client_key"]:
-                cert_path = getattr(config, cert_attr, None)
-                if cert_path and Path(cert_path).exists():
-                    try:
-                        os.unlink(cert_path)
-                        logging.debug("Cleaned up %s file: %s", cert_attr, cert_path)
-                    except OSError as e:
-                        logging.warning("Failed to delete %s file %s: %s", cert_attr, cert_path, e)
-
-            config.ca_cert = None
-            config.client_cert = None
-            config.client_key = None
-
-        # Process repositories selection
-        repositories = request.form.to_dict(flat=False).get("repositories", None)
-        if repositories:
-            config.repositories = ",".join(repositories)
-        else:
-            config.repositories = None
-
-        db.session.add(config)
+
+def _get_or_create_config() -> DockerConfig:
+    """Get existing DockerConfig or create a new one."""
+    docker = get_docker_config()
+    if not docker:
+        logging.info("No docker config was found, setting empty one.")
+        docker = DockerConfig()
+        db.session.add(docker)
         db.session.commit()
+        g.docker_config = docker
+    return docker
 
-    def _get_repository_choices(docker: DockerConfig, form: DockerConfigForm) -> None:
-        """Fetch available Docker repositories and set form choices."""
-        try:
-            repos = get_repositories(docker)
-        except Exception:
-            logging.error(traceback.print_exc())
-            repos = []
 
-        if len(repos) == 0:
-            form.repositories.choices = [("ERROR", "Failed to load repositories")]
-        else:
-            form.repositories.choices = [(d, d) for d in repos]
+def _process_docker_config_form(config: DockerConfig) -> None:
+    """Process POST form data to update Docker configuration."""
+    __handle_file_upload("ca_cert", config, "ca_cert")
+    __handle_file_upload("client_cert", config, "client_cert")
+    __handle_file_upload("client_key", config, "client_key")
 
-    def _get_selected_repositories(config: DockerConfig) -> list:
-        """Get currently selected repositories from config."""
-        try:
-            selected_repos = config.repositories
-            if selected_repos is None:
-                selected_repos = []
-        except Exception:
-            logging.error(traceback.print_exc())
-            selected_repos = []
-        return selected_repos
+    config.hostname = request.form["hostname"]
 
-    @admin_docker_config.route("/admin/docker_config", methods=["GET", "POST"])
-    @admins_only
-    def docker_config():
-        """Admin page for configuring Docker host connection and repositories."""
-        # Get or create configuration
-        docker = _get_or_create_config()
-        form = DockerConfigForm()
+    # Handle TLS enablement
+    config.tls_enabled = False
+    if "tls_enabled" in request.form:
+        config.tls_enabled = request.form["tls_enabled"] == "True"
 
-        # Validate TLS certificates exist
-        _validate_tls_certificates(docker)
+    # Clear TLS certs if TLS is disabled
+    if not config.tls_enabled:
+        for cert_attr in ("ca_cert", "client_cert", "client_key"):
+            _clear_cert(config, cert_attr)
 
-        # Process form submission
-        if request.method == "POST":
-            _process_docker_config_form(docker)
-            docker = DockerConfig.query.filter_by(id=1).first()
+    # Process repositories selection
+    repositories = request.form.getlist("repositories")
+    config.repositories = ",".join(repositories) if repositories else None
 
-        # Fetch repositories and populate form choices
-        _get_repository_choices(docker, form)
-
-        # Get currently selected repositories
-        selected_repos = _get_selected_repositories(docker)
+    # Config is already persistent; skip the commit when the form changed nothing
+    if db.session.is_modified(config):
+        db.session.commit()
+        clear_lookup_cache()
+        close_docker_connections()
 
-        # Get Docker daemon info
-        dinfo = get_docker_info(docker)
 
-        return render_template(
-            "docker_config.html",
-            config=docker,
-            form=form,
-            repos=selected_repos,
-            info=dinfo,
-        )
+def _get_repository_choices(docker: DockerConfig, form: DockerConfigForm) -> None:
+    """Fetch available Docker repositories and set form choices."""
+    try:
+        repos = _admin_lookup(docker, "repositories")
+    except Exception:
+        logging.exception("Failed to load Docker repositories")
+        repos = []
 
-    app.register_blueprint(admin_docker_config)
+    if len(repos) == 0:
+        form.repositories.choices = [("ERROR", "Failed to load repositories")]
+    else:
+        form.repositories.choices = _repository_choices(tuple(repos))
 
 
-def define_docker_status(app):
-    admin_docker_status = Blueprint(
-        "admin_docker_status",
-        __name__,
-        template_folder="templates",
-        static_folder="assets",
+def _get_selected_repositories(config: DockerConfig) -> list:
+    """Get currently selected repositories from config."""
+    try:
+        selected_repos = config.repositories
+        if selected_repos is None:
+            selected_repos = []
+    except Exception:
+        logging.exception("Failed to read selected repositories from config")
+        selected_repos = []
+    return selected_repos
+
+
+@admin_docker_config.route("/admin/docker_config", methods=["GET", "POST"])
+@admins_only
+def docker_config():
+    """Admin page for configuring Docker host connection and repositories."""
+    # Get or create configuration
+    docker = _get_or_create_config()
+    form = DockerConfigForm()
+
+    # Validate TLS certificates exist
+    _validate_tls_certificates(docker)
+
+    # Process form submission
+    if request.method == "POST":
+        _process_docker_config_form(docker)
+
+    # Fetch repositories and populate form choices
+    _get_repository_choices(docker, form)
+
+    # Get currently selected repositories
+    selected_repos = _get_selected_repositories(docker)
+
+    # Get Docker daemon info
+    dinfo = _admin_lookup(docker, "docker_info")
+
+    return render_template(
+        "docker_config.html",
+        config=docker,
+        form=form,
+        repos=selected_repos,
+        info=dinfo,
     )
 
-    @admin_docker_status.route("/admin/docker_status", methods=["GET", "POST"])
-    @admins_only
-    def docker_admin():
-        try:
-            docker_tracker = DockerChallengeTracker.query.all()
-            for i in docker_tracker:
-                if is_teams_mode():
-                    name = Teams.query.filter_by(id=i.team_id).first()
-                    i.team_id = name.name
-                else:
-                    name = Users.query.filter_by(id=i.user_id).first()
-                    i.user_id = name.name
-        except InternalError as err:
-            logging.error(err)
-            return render_template("admin_docker_status.html", dockers=[])
-
-        return render_template("admin_docker_status.html", dockers=docker_tracker)
 
-    app.register_blueprint(admin_docker_status)
+admin_docker_status = Blueprint(
+    "admin_docker_status",
+    __name__,
+    template_folder="templates",
+    static_folder="assets",
+)
 
 
-def define_docker_secrets(app):
-    """Admin blueprint for managing Docker secrets."""
-    admin_docker_secrets = Blueprint(
-        "admin_docker_secrets",
-        __name__,
-        template_folder="templates",
-        static_folder="assets",
+def _get_tracker_rows() -> list[dict]:
+    """Load active trackers with their owning team/user name in a single query."""
+    teams_mode = is_teams_mode()
+    owner = Teams if teams_mode else Users
+    owner_column = DockerChallengeTracker.team_id if teams_mode else DockerChallengeTracker.user_id
+
+    # Tracker owner ids are stored as strings, so cast before joining on the integer PK
+    # Only the rendered columns are selected, so no tracker instances enter the session
+    results = (
+        db.session.query(
+            DockerChallengeTracker.id,
+            DockerChallengeTracker.docker_image,
+            DockerChallengeTracker.instance_id,
+            owner.name,
+        )
+        .outerjoin(owner, owner.id == cast(owner_column, Integer))
+        .all()
     )
 
-    @admin_docker_secrets.route("/admin/docker_secrets", methods=["GET"])
-    @admins_only
-    def docker_secrets():
-        """Admin page for viewing and managing Docker secrets."""
-        try:
-            docker = DockerConfig.query.filter_by(id=1).first()
-            if not docker:
-                logging.error("Docker configuration not found")
-                return render_template(
-                    "admin_docker_secrets.html",
-                    secrets=[],
-                    swarm_mode=False,
-                    errors=["Docker not configured"],
-                    docker=None,
-                )
-
-            swarm_mode = is_swarm_mode(docker)
-            secrets = get_secrets(docker)
-            secrets_sorted = sorted(secrets, key=lambda s: s["Name"])
-
-        except Exception as err:
-            logging.error("Error loading secrets: %s", err)
+    return [
+        {
+            "id": tracker_id,
+            "team_id": owner_name if teams_mode else None,
+            "user_id": None if teams_mode else owner_name,
+            "docker_image": docker_image,
+            "instance_id": instance_id,
+        }
+        for tracker_id, docker_image, instance_id, owner_name in results
+    ]
+
+
+def _tracker_etag() -> str:
+    """Fingerprint the tracker table cheaply so unchanged status pages can 304."""
+    count, max_id, max_timestamp = db.session.query(
+        func.count(DockerChallengeTracker.id),
+        func.max(DockerChallengeTracker.id),
+        func.max(DockerChallengeTracker.timestamp),
+    ).one()
+    state = (is_teams_mode(), count, max_id, max_timestamp)
+    return hashlib.md5(repr(state).encode(), usedforsecurity=False).hexdigest()
+
+
+def _cacheable_response(body: str, etag: str | None = None):
+    """Wrap an admin page with an ETag the browser must revalidate before every reuse.
+
+    no-cache (rather than a max-age) keeps pages fresh after redirects such as "nuke all",
+    while unchanged pages are still answered with a cheap 304.
+    """
+    response = make_response(body)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    if etag:
+        response.set_etag(etag)
+    else:
+        response.add_etag()
+    return response.make_conditional(request)
+
+
+@admin_docker_status.route("/admin/docker_status", methods=["GET", "POST"])
+@admins_only
+def docker_admin():
+    try:
+        etag = _tracker_etag()
+        # Answer repeat polls before running the tracker/owner join
+        if request.method == "GET" and etag in request.if_none_match:
+            return _cacheable_response("", etag)
+        dockers = _get_tracker_rows()
+    except InternalError as err:
+        logging.error(err)
+        return render_template("admin_docker_status.html", dockers=[])
+
+    return _cacheable_response(render_template("admin_docker_status.html", dockers=dockers), etag)
+
+
+# Admin blueprint for managing Docker secrets
+admin_docker_secrets = Blueprint(
+    "admin_docker_secrets",
+    __name__,
+    template_folder="templates",
+    static_folder="assets",
+)
+
+
+@admin_docker_secrets.route("/admin/docker_secrets", methods=["GET"])
+@admins_only
+def docker_secrets():
+    """Admin page for viewing and managing Docker secrets."""
+    try:
+        docker = get_docker_config()
+        if not docker:
+            logging.error("Docker configuration not found")
             return render_template(
                 "admin_docker_secrets.html",
                 secrets=[],
                 swarm_mode=False,
-                errors=[str(err)],
+                errors=["Docker not configured"],
                 docker=None,
             )
 
+        swarm_mode = _admin_lookup(docker, "swarm_mode")
+        # Secrets share the API's cached list; sort by name and optionally page through them
+        secrets = sorted(_admin_lookup(docker, "secret_list"), key=itemgetter("Name"))
+        offset = max(request.args.get("offset", 0, type=int), 0)
+        limit = max(request.args.get("limit", 0, type=int), 0)
+        secrets_page = secrets[offset : offset + limit] if limit else secrets[offset:]
+
+    except Exception as err:
+        logging.error("Error loading secrets: %s", err)
         return render_template(
             "admin_docker_secrets.html",
-            secrets=secrets_sorted,
+            secrets=[],
+            swarm_mode=False,
+            errors=[str(err)],
+            docker=None,
+        )
+
+    return _cacheable_response(
+        render_template(
+            "admin_docker_secrets.html",
+            secrets=secrets_page,
             swarm_mode=swarm_mode,
             docker=docker,
         )
+    )
 
-    app.register_blueprint(admin_docker_secrets)
+
+def _init_cert_dir(app) -> None:
+    """Create the disk-backed directory uploaded TLS certificates are written to."""
+    cert_dir = os.environ.get("DOCKER_PLUGIN_CERT_DIR") or os.path.join(
+        app.instance_path, "docker_certs"
+    )
+    os.makedirs(cert_dir, mode=0o700, exist_ok=True)
+    app.config["DOCKER_PLUGIN_CERT_DIR"] = cert_dir
+
+
+def _create_missing_tables(app) -> None:
+    """Run create_all only when a plugin table is missing, keeping worker boot cheap."""
+    plugin_tables = {
+        model.__table__.name
+        for model in (DockerConfig, DockerChallengeTracker, DockerChallenge, DockerServiceChallenge)
+    }
+    if plugin_tables - set(inspect(app.db.engine).get_table_names()):
+        app.db.create_all()
+
+
+def _create_missing_indexes(app) -> None:
+    """Add tracker indexes introduced after the table was first created."""
+    table = DockerChallengeTracker.__table__
+    existing = {index["name"] for index in inspect(app.db.engine).get_indexes(table.name)}
+    for index in table.indexes:
+        if index.name not in existing:
+            logging.info("Creating missing index %s on %s", index.name, table.name)
+            index.create(bind=app.db.engine)
+
+
+# In-place BIGINT upgrade statements per dialect (SQLite integers are already 64-bit)
+_WIDEN_COLUMN_SQL = {
+    "mysql": "ALTER TABLE {table} MODIFY {column} BIGINT",
+    "mariadb": "ALTER TABLE {table} MODIFY {column} BIGINT",
+    "postgresql": "ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT",
+}
+
+
+def _widen_tracker_time_columns(app) -> None:
+    """Upgrade tracker time columns created as 32-bit INTEGER to BIGINT."""
+    engine = app.db.engine
+    statement = _WIDEN_COLUMN_SQL.get(engine.dialect.name)
+    if not statement:
+        return
+    table = DockerChallengeTracker.__table__.name
+    columns = {column["name"]: column["type"] for column in inspect(engine).get_columns(table)}
+    narrow = [
+        name
+        for name in ("timestamp", "revert_time")
+        if name in columns and not isinstance(columns[name], BigInteger)
+    ]
+    if not narrow:
+        return
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as connection:
+        for name in narrow:
+            logging.info("Widening %s.%s to BIGINT", table, name)
+            connection.execute(text(statement.format(table=quote(table), column=quote(name))))
 
 
 def load(app):
-    app.db.create_all()
+    _create_missing_tables(app)
+    _widen_tracker_time_columns(app)
+    _create_missing_indexes(app)
+    _init_cert_dir(app)
 
     CHALLENGE_CLASSES["docker"] = DockerChallengeType
     CHALLENGE_CLASSES["docker_service"] = DockerServiceChallengeType
 
     register_plugin_assets_directory(app, base_path="/plugins/docker_challenges/assets")
 
-    define_docker_admin(app)
-    define_docker_status(app)
-    define_docker_secrets(app)
+    app.register_blueprint(admin_docker_config)
+    app.register_blueprint(admin_docker_status)
+    app.register_blueprint(admin_docker_secrets)
+
+    # Started from the first request in each worker process, never in a --preload master
+    app.before_request(_ensure_background_workers)
 
     CTFd_API_v1.add_namespace(docker_namespace, "/docker")
     CTFd_API_v1.add_namespace(container_namespace, "/container")
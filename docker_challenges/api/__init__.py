@@ -1,7 +1,9 @@
 from .api import (
     active_docker_namespace,
+    cleanup_stale_containers,
     container_namespace,
     docker_namespace,
+    get_docker_config,
     image_ports_namespace,
     kill_container,
     secret_namespace,
@@ -9,8 +11,10 @@ from .api import (
 
 __all__ = [
     "active_docker_namespace",
+    "cleanup_stale_containers",
     "container_namespace",
     "docker_namespace",
+    "get_docker_config",
     "image_ports_namespace",
     "kill_container",
     "secret_namespace",
@@ -1,21 +1,30 @@
-import json
+import functools
 import logging
 import re
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from itertools import islice
+from typing import Any, Callable
 
-from CTFd.models import db
+from CTFd.models import Challenges, db
 from CTFd.utils.config import is_teams_mode
 from CTFd.utils.dates import unix_time
 from CTFd.utils.decorators import admins_only, authed_only
 from CTFd.utils.user import get_current_team, get_current_user
-from flask import request
+from flask import g, request
 from flask_restx import Namespace, Resource
+from sqlalchemy.orm import with_polymorphic
 
-from ..constants import CONTAINER_REVERT_TIMEOUT_SECONDS, CONTAINER_STALE_TIMEOUT_SECONDS
+from ..constants import (
+    CONTAINER_REVERT_TIMEOUT_SECONDS,
+    CONTAINER_STALE_TIMEOUT_SECONDS,
+    DOCKER_DELETE_MAX_WORKERS,
+    TRACKER_DELETE_CHUNK_SIZE,
+)
 from ..functions.containers import create_container, delete_container
 from ..functions.general import (
+    cached_lookup,
+    clear_lookup_cache,
     create_secret,
     delete_secret,
     get_repositories,
@@ -43,64 +52,161 @@ image_ports_namespace = Namespace(
     "image_ports", description="Endpoint to retrieve image exposed ports"
 )
 
+# Polymorphic identities of the plugin's challenge models (Challenges.type values)
+_DOCKER_CHALLENGE_TYPES = ("docker", "docker_service")
+
+# Docker image reference: [registry/][namespace/]name[:tag][@digest]
+# Examples: nginx, nginx:latest, myregistry.com/user/image:v1.0
+_DOCKER_IMAGE_RE = re.compile(
+    r"^(?:(?:[a-z0-9]+(?:[._-][a-z0-9]+)*\.)*[a-z0-9]+(?:[._-][a-z0-9]+)*(?::[0-9]+)?/)?"
+    r"(?:[a-z0-9._-]+/)?"
+    r"[a-z0-9._-]+"
+    r"(?::[a-zA-Z0-9._-]+)?"
+    r"(?:@sha256:[a-f0-9]{64})?$",
+    re.IGNORECASE,
+)
+_SECRET_NAME_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+_SECRET_ID_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+# Docker-side deleters by challenge type; unknown types are treated as standalone containers
+_RESOURCE_DELETERS: dict[str, tuple[str, Callable[[DockerConfig, str], bool]]] = {
+    "docker": ("container", delete_container),
+    "docker_service": ("service", delete_service),
+}
+
+
+def get_docker_config() -> DockerConfig | None:
+    """Return the DockerConfig singleton, loaded at most once per request."""
+    if "docker_config" not in g:
+        g.docker_config = db.session.get(DockerConfig, 1)
+    return g.docker_config
+
+
+def _docker_host(docker: DockerConfig) -> str:
+    """Return the Docker host name players connect to (hostname without the API port)."""
+    return str(docker.hostname).split(":", 1)[0]
+
+
+def _session_context() -> tuple[Any, bool]:
+    """Return the current team (in teams mode) or user, and whether teams mode is on."""
+    is_teams = is_teams_mode()
+    return (get_current_team() if is_teams else get_current_user()), is_teams
+
+
+def _owner_filter(session: Any, is_teams: bool) -> dict[str, Any]:
+    """Tracker filter_by() criteria selecting the rows owned by session."""
+    return {"team_id": session.id} if is_teams else {"user_id": session.id}
+
+
+def _delete_docker_resource(docker: DockerConfig, docker_type: str, instance_id: str) -> bool:
+    """Delete a Docker container or service without touching the tracker.
+
+    Returns:
+        True if deletion succeeded, False otherwise.
+    """
+    kind, delete = _RESOURCE_DELETERS.get(docker_type, _RESOURCE_DELETERS["docker"])
+    if not delete(docker, instance_id):
+        logging.warning("Failed to delete Docker %s: %s", kind, instance_id)
+        return False
+    return True
+
 
 def delete_docker(docker: DockerConfig, docker_type: str, instance_id: str) -> bool:
     """Delete a Docker container or service and remove from tracker.
 
+    Commits immediately; loops should use _delete_docker_resource and
+    _delete_tracker_entries so the tracker rows go in one commit.
+
     Returns:
         True if deletion succeeded, False otherwise.
     """
-    if docker_type == "docker_service":
-        if not delete_service(docker, instance_id):
-            logging.warning("Failed to delete Docker service: %s", instance_id)
-            return False
-    else:
-        if not delete_container(docker, instance_id):
-            logging.warning("Failed to delete Docker container: %s", instance_id)
-            return False
-    DockerChallengeTracker.query.filter_by(instance_id=instance_id).delete()
+    if not _delete_docker_resource(docker, docker_type, instance_id):
+        return False
+    DockerChallengeTracker.query.filter_by(instance_id=instance_id).delete(
+        synchronize_session=False
+    )
     db.session.commit()
     return True
 
 
-def _cleanup_stale_containers(docker: DockerConfig, session: Any, is_teams: bool) -> None:
-    """Clean up containers older than CONTAINER_STALE_TIMEOUT_SECONDS for current session."""
+def _delete_tracker_entries(instance_ids: list[str]) -> None:
+    """Remove tracker rows for the given instances and commit once.
+
+    IDs are deleted in chunks of TRACKER_DELETE_CHUNK_SIZE to keep the number of
+    bound parameters per statement bounded.
+    """
+    if not instance_ids:
+        return
+    for start in range(0, len(instance_ids), TRACKER_DELETE_CHUNK_SIZE):
+        chunk = instance_ids[start : start + TRACKER_DELETE_CHUNK_SIZE]
+        DockerChallengeTracker.query.filter(DockerChallengeTracker.instance_id.in_(chunk)).delete(
+            synchronize_session=False
+        )
+    db.session.commit()
+
+
+def _tracker_targets(**criteria: Any) -> Any:
+    """Query (instance_id, challenge type) for tracked instances matching criteria.
+
+    Trackers whose challenge no longer exists, or is not a Docker challenge, are excluded.
+    """
+    return (
+        db.session.query(DockerChallengeTracker.instance_id, Challenges.type)
+        .select_from(DockerChallengeTracker)
+        # filter_by() targets the tracker here, so it must precede the join
+        .filter_by(**criteria)
+        .join(Challenges, Challenges.id == DockerChallengeTracker.challenge_id)
+        .filter(Challenges.type.in_(_DOCKER_CHALLENGE_TYPES))
+    )
+
+
+def cleanup_stale_containers(
+    docker: DockerConfig, session: Any = None, is_teams: bool = False
+) -> None:
+    """Clean up containers older than CONTAINER_STALE_TIMEOUT_SECONDS.
+
+    Args:
+        docker: DockerConfig instance
+        session: Team or user whose containers to sweep, or None for every owner
+        is_teams: Whether session is a team
+    """
     # Calculate stale timestamp threshold
     current_time = unix_time(datetime.utcnow())
     stale_threshold = current_time - CONTAINER_STALE_TIMEOUT_SECONDS
 
-    # Filter at database level: only query current session's stale containers
-    query = DockerChallengeTracker.query
-    query = query.filter_by(team_id=session.id) if is_teams else query.filter_by(user_id=session.id)
-
-    # Further filter by timestamp at database level
-    containers = query.filter(DockerChallengeTracker.timestamp <= str(stale_threshold)).all()
+    # One query: the given session's stale instances joined to their challenge type
+    owner = _owner_filter(session, is_teams) if session is not None else {}
+    targets = (
+        _tracker_targets(**owner).filter(DockerChallengeTracker.timestamp <= stale_threshold).all()
+    )
 
-    for container in containers:
-        challenge = DockerChallenge.query.filter_by(id=container.challenge_id).first()
-        if not challenge:
-            challenge = DockerServiceChallenge.query.filter_by(id=container.challenge_id).first()
+    deleted = []
+    for instance_id, challenge_type in targets:
+        if _delete_docker_resource(docker, challenge_type, instance_id):
+            deleted.append(instance_id)
+        else:
+            logging.warning("Stale cleanup failed for %s, skipping", instance_id)
 
-        if challenge:
-            if not delete_docker(docker, challenge.type, container.instance_id):
-                logging.warning("Stale cleanup failed for %s, skipping", container.instance_id)
+    _delete_tracker_entries(deleted)
 
 
 def _get_existing_container(
     session: Any, challenge: DockerChallenge | DockerServiceChallenge, is_teams: bool
-) -> DockerChallengeTracker | None:
-    """Get existing container for session and challenge if it exists."""
-    query = DockerChallengeTracker.query
-    query = query.filter_by(team_id=session.id) if is_teams else query.filter_by(user_id=session.id)
-
+) -> Any | None:
+    """Get (instance_id, timestamp) of the session's container for a challenge, if any."""
+    # Only the revert decision and deletion need these two columns; skip ORM hydration
     return (
-        query.filter_by(docker_image=challenge.docker_image)
-        .filter_by(challenge_id=challenge.id)
+        DockerChallengeTracker.query.filter_by(
+            **_owner_filter(session, is_teams),
+            docker_image=challenge.docker_image,
+            challenge_id=challenge.id,
+        )
+        .with_entities(DockerChallengeTracker.instance_id, DockerChallengeTracker.timestamp)
         .first()
     )
 
 
-def _should_revert_container(existing_container: DockerChallengeTracker | None) -> bool:
+def _should_revert_container(existing_container: Any | None) -> bool:
     """Check if container should be reverted (older than CONTAINER_REVERT_TIMEOUT_SECONDS)."""
     if not existing_container:
         return False
@@ -109,20 +215,28 @@ def _should_revert_container(existing_container: DockerChallengeTracker | None)
     return age_seconds >= CONTAINER_REVERT_TIMEOUT_SECONDS
 
 
+@functools.cache
+def _docker_challenge_entity():
+    """Polymorphic Challenges entity that loads both Docker subtypes in one SELECT."""
+    return with_polymorphic(Challenges, [DockerChallenge, DockerServiceChallenge])
+
+
 def _get_challenge_by_id(challenge_id: int) -> DockerChallenge | DockerServiceChallenge | None:
     """Retrieve challenge by ID, checking both Docker and DockerService types."""
-    challenge = DockerChallenge.query.filter_by(id=challenge_id).first()
-    if not challenge:
-        challenge = DockerServiceChallenge.query.filter_by(id=challenge_id).first()
-    return challenge
+    entity = _docker_challenge_entity()
+    return (
+        db.session.query(entity)
+        .filter(entity.id == challenge_id, entity.type.in_(_DOCKER_CHALLENGE_TYPES))
+        .first()
+    )
 
 
 def _create_docker_instance(
     docker: DockerConfig,
     challenge: DockerChallenge | DockerServiceChallenge,
     session: Any,
-    portsbl: list[int],
-) -> tuple[str | None, list[str] | None, str | None]:
+    portsbl: set[int],
+) -> tuple[str | None, list[str] | None, dict | None]:
     """Create a new Docker container or service instance."""
     if challenge.docker_type == "service":
         instance_id, data = create_service(
@@ -135,16 +249,20 @@ def _create_docker_instance(
         if not instance_id or data is None:
             return None, None, None
 
-        ports_json = json.loads(data)["EndpointSpec"]["Ports"]
-        ports = [f"{p['PublishedPort']}/{p['Protocol']}-> {p['TargetPort']}" for p in ports_json]
+        ports = [
+            f"{p['PublishedPort']}/{p['Protocol']}-> {p['TargetPort']}"
+            for p in data["EndpointSpec"]["Ports"]
+        ]
     else:
         instance_id, data = create_container(
             docker, challenge.docker_image, session.name, portsbl, challenge.exposed_ports
         )
         if not instance_id or data is None:
             return None, None, None
-        ports_json = json.loads(data)["HostConfig"]["PortBindings"]
-        ports = [f"{values[0]['HostPort']}->{target}" for target, values in ports_json.items()]
+        ports = [
+            f"{values[0]['HostPort']}->{target}"
+            for target, values in data["HostConfig"]["PortBindings"].items()
+        ]
 
     return instance_id, ports, data
 
@@ -155,10 +273,10 @@ def _handle_container_creation(
     session: Any,
     is_teams: bool,
 ) -> tuple[str, list[str]] | None | bool:
-    """Handle complete container/service creation workflow."""
-    # Clean up stale containers (older than 2 hours)
-    _cleanup_stale_containers(docker, session, is_teams)
+    """Handle complete container/service creation workflow.
 
+    Stale containers are swept by a background worker, not on this request path.
+    """
     # Check for existing container
     existing = _get_existing_container(session, challenge, is_teams)
 
@@ -174,7 +292,9 @@ def _handle_container_creation(
                 "Removing stale tracker entry so new instance can be tracked.",
                 existing.instance_id,
             )
-            DockerChallengeTracker.query.filter_by(instance_id=existing.instance_id).delete()
+            DockerChallengeTracker.query.filter_by(instance_id=existing.instance_id).delete(
+                synchronize_session=False
+            )
             db.session.commit()
 
     # Create new container/service
@@ -184,50 +304,48 @@ def _handle_container_creation(
     return (instance_id, ports) if instance_id else False
 
 
-def _get_all_challenges() -> dict[int, DockerChallenge | DockerServiceChallenge]:
-    """Get all challenges indexed by ID."""
-    challenges = {c.id: c for c in DockerChallenge.query.all()}
-    challenges.update({c.id: c for c in DockerServiceChallenge.query.all()})
-    return challenges
+def _kill_all_containers(docker_config: DockerConfig) -> None:
+    """Kill all tracked containers, issuing the Docker API deletes concurrently.
 
+    Tracker rows are read 200 at a time and each batch is deleted before the next
+    is fetched, so only one batch of rows is held in memory.
+    """
 
-def _kill_all_containers(
-    docker_config: DockerConfig,
-    challenges: dict[int, DockerChallenge | DockerServiceChallenge],
-) -> None:
-    """Kill all tracked containers using streaming to prevent memory exhaustion."""
-    # Stream containers in batches of 100 to avoid loading all into memory
-    for tracker_entry in DockerChallengeTracker.query.yield_per(100):
-        challenge = challenges.get(tracker_entry.challenge_id)
-        if challenge:
-            logging.debug("type:%s", challenge.type)
-            logging.debug("instance_id:%s", tracker_entry.instance_id)
-            if not delete_docker(
-                docker=docker_config,
-                docker_type=challenge.type,
-                instance_id=tracker_entry.instance_id,
-            ):
-                logging.warning("Nuke: failed to delete %s, continuing", tracker_entry.instance_id)
+    def _delete(target: tuple[str, str]) -> bool:
+        instance_id, challenge_type = target
+        logging.debug("Nuke: deleting %s instance %s", challenge_type, instance_id)
+        return _delete_docker_resource(docker_config, challenge_type, instance_id)
+
+    rows = iter(_tracker_targets().yield_per(200))
+    deleted = []
+    # Deletes are independent network round-trips; overlap them instead of paying N x RTT
+    with ThreadPoolExecutor(max_workers=DOCKER_DELETE_MAX_WORKERS) as pool:
+        while batch := list(islice(rows, 200)):
+            for (instance_id, _challenge_type), ok in zip(batch, pool.map(_delete, batch)):
+                if ok:
+                    deleted.append(instance_id)
+                else:
+                    logging.warning("Nuke: failed to delete %s, continuing", instance_id)
+
+    # Untrack everything that was removed in one statement once the pool is done
+    _delete_tracker_entries(deleted)
 
 
 def _kill_single_container(
     docker_config: DockerConfig,
-    container_id: str,
-    docker_tracker: list[DockerChallengeTracker],
-    challenges: dict[int, DockerChallenge | DockerServiceChallenge],
+    target: tuple[str, str] | None,
 ) -> tuple[dict, int] | None:
-    """Kill a specific container by ID."""
-    tracker_entry = next((c for c in docker_tracker if c.instance_id == container_id), None)
-    if not tracker_entry:
-        return {"success": False, "error": "Container not found"}, 404
+    """Kill a specific tracked container.
 
-    challenge = challenges.get(tracker_entry.challenge_id)
-    if not challenge:
-        return {"success": False, "error": "Challenge not found"}, 404
+    Args:
+        docker_config: DockerConfig instance
+        target: (instance_id, challenge type) row from _tracker_targets(), or None
+    """
+    if not target:
+        return {"success": False, "error": "Container not found"}, 404
 
-    if not delete_docker(
-        docker=docker_config, docker_type=challenge.type, instance_id=tracker_entry.instance_id
-    ):
+    instance_id, challenge_type = target
+    if not delete_docker(docker=docker_config, docker_type=challenge_type, instance_id=instance_id):
         return {"success": False, "error": "Failed to delete container"}, 500
     return None
 
@@ -249,25 +367,23 @@ class KillContainerAPI(Resource):
         container = data.get("container")
         full = data.get("all")
 
-        docker_config = DockerConfig.query.filter_by(id=1).first_or_404()
-        challenges = _get_all_challenges()
+        docker_config = get_docker_config()
+        if not docker_config:
+            return {"success": False, "error": "Docker configuration not found"}, 404
 
         # Kill all containers if requested
         if _is_truthy(full):
-            _kill_all_containers(docker_config, challenges)
+            _kill_all_containers(docker_config)
             return {"success": True}, 200
 
         # Kill single container
         if container and container != "null":
-            # Query only the specific container instead of loading all containers
-            tracker_entry = DockerChallengeTracker.query.filter_by(instance_id=container).first()
-            if tracker_entry:
-                error = _kill_single_container(
-                    docker_config, container, [tracker_entry], challenges
-                )
-                if error:
-                    return error
-                return {"success": True}, 200
+            # Query only the specific container and its challenge type
+            target = _tracker_targets(instance_id=container).first()
+            error = _kill_single_container(docker_config, target)
+            if error:
+                return error
+            return {"success": True}, 200
 
         return {"success": False, "error": "Invalid request"}, 400
 
@@ -292,26 +408,30 @@ def _parse_container_request() -> tuple[str | None, str | None]:
 
 
 def _track_container(
-    docker: DockerConfig,
+    host: str,
     challenge: DockerChallenge | DockerServiceChallenge,
     session: Any,
     is_teams: bool,
     instance_id: str,
     ports: list[str],
 ) -> None:
-    """Record a new container in the challenge tracker."""
-    entry = DockerChallengeTracker(
-        team_id=session.id if is_teams else None,
-        user_id=session.id if not is_teams else None,
-        challenge_id=challenge.id,
-        docker_image=challenge.docker_image,
-        timestamp=unix_time(datetime.utcnow()),
-        revert_time=unix_time(datetime.utcnow()) + CONTAINER_REVERT_TIMEOUT_SECONDS,
-        instance_id=instance_id,
-        ports=",".join(ports),
-        host=str(docker.hostname).split(":")[0],
-    )
-    db.session.add(entry)
+    """Record a new container in the challenge tracker.
+
+    The row is inserted from a plain mapping, skipping ORM object construction and
+    unit-of-work bookkeeping; nothing on the request path reads it back.
+    """
+    now = unix_time(datetime.utcnow())
+    entry = {
+        **_owner_filter(session, is_teams),
+        "challenge_id": challenge.id,
+        "docker_image": challenge.docker_image,
+        "timestamp": now,
+        "revert_time": now + CONTAINER_REVERT_TIMEOUT_SECONDS,
+        "instance_id": instance_id,
+        "ports": ",".join(ports),
+        "host": host,
+    }
+    db.session.bulk_insert_mappings(DockerChallengeTracker, [entry])
     db.session.commit()
 
 
@@ -325,13 +445,12 @@ class ContainerAPI(Resource):
         if error:
             return {"success": False, "error": error}, 400
 
-        docker = DockerConfig.query.filter_by(id=1).first()
+        docker = get_docker_config()
         challenge = _get_challenge_by_id(challenge_id)
         if not challenge:
             return {"success": False, "error": "Challenge not found"}, 404
 
-        is_teams = is_teams_mode()
-        session = get_current_team() if is_teams else get_current_user()
+        session, is_teams = _session_context()
 
         result = _handle_container_creation(docker, challenge, session, is_teams)
         if not result:
@@ -341,8 +460,9 @@ class ContainerAPI(Resource):
             return {"success": False, "error": error_msg}, 403 if result is None else 500
 
         instance_id, ports = result
+        host = _docker_host(docker)
         try:
-            _track_container(docker, challenge, session, is_teams, instance_id, ports)
+            _track_container(host, challenge, session, is_teams, instance_id, ports)
         except Exception:
             logging.error(
                 "DB commit failed after creating %s instance %s; rolling back Docker resource",
@@ -360,7 +480,7 @@ class ContainerAPI(Resource):
             "data": {
                 "instance_id": instance_id,
                 "ports": ports,
-                "host": str(docker.hostname).split(":")[0],
+                "host": host,
             },
         }, 201
 
@@ -374,29 +494,24 @@ class DockerStatus(Resource):
 
     @authed_only
     def get(self):
-        docker = DockerConfig.query.filter_by(id=1).first()
-        if is_teams_mode():
-            session = get_current_team()
-            tracker = DockerChallengeTracker.query.filter_by(team_id=session.id)
-        else:
-            session = get_current_user()
-            tracker = DockerChallengeTracker.query.filter_by(user_id=session.id)
-        data = []
-        for tracker_entry in tracker:
-            data.append(
-                {
-                    "id": tracker_entry.id,
-                    "team_id": tracker_entry.team_id,
-                    "user_id": tracker_entry.user_id,
-                    "challenge_id": tracker_entry.challenge_id,
-                    "docker_image": tracker_entry.docker_image,
-                    "timestamp": tracker_entry.timestamp,
-                    "revert_time": tracker_entry.revert_time,
-                    "instance_id": tracker_entry.instance_id,
-                    "ports": tracker_entry.ports.split(","),
-                    "host": str(docker.hostname).split(":")[0],
-                }
-            )
+        docker = get_docker_config()
+        session, is_teams = _session_context()
+        tracker = DockerChallengeTracker.query.filter_by(**_owner_filter(session, is_teams))
+
+        # Select only the serialized columns; rows are plain named tuples, not ORM objects
+        rows = tracker.with_entities(
+            DockerChallengeTracker.id,
+            DockerChallengeTracker.team_id,
+            DockerChallengeTracker.user_id,
+            DockerChallengeTracker.challenge_id,
+            DockerChallengeTracker.docker_image,
+            DockerChallengeTracker.timestamp,
+            DockerChallengeTracker.revert_time,
+            DockerChallengeTracker.instance_id,
+            DockerChallengeTracker.ports,
+        ).all()
+        host = _docker_host(docker)
+        data = [{**row._asdict(), "ports": row.ports.split(","), "host": host} for row in rows]
         return {"success": True, "data": data}
 
 
@@ -409,8 +524,12 @@ class DockerAPI(Resource):
 
     @admins_only
     def get(self):
-        docker = DockerConfig.query.filter_by(id=1).first()
-        images = get_repositories(docker, tags=True, repos=docker.repositories)
+        docker = get_docker_config()
+        images = cached_lookup(
+            docker,
+            f"repository_tags:{docker.repositories}",
+            lambda: get_repositories(docker, tags=True, repos=docker.repositories),
+        )
         if images:
             data = []
             for i in images:
@@ -449,7 +568,7 @@ def _validate_secret_request(data: dict) -> tuple[str | None, str | None, str |
         return None, None, "Secret name is required"
     if not secret_value:
         return None, None, "Secret value is required"
-    if not re.match(r"^[a-zA-Z0-9._-]+$", secret_name):
+    if not _SECRET_NAME_RE.match(secret_name):
         return (
             None,
             None,
@@ -470,7 +589,7 @@ def _check_secret_uniqueness(docker: DockerConfig, secret_name: str) -> str | No
     Returns:
         Error message if secret exists, None otherwise.
     """
-    existing_secrets = get_secrets(docker)
+    existing_secrets = cached_lookup(docker, "secret_list", lambda: get_secrets(docker))
     if any(s["Name"] == secret_name for s in existing_secrets):
         return f"Secret name '{secret_name}' already in use"
     return None
@@ -488,9 +607,9 @@ class SecretAPI(Resource):
 
     @admins_only
     def get(self):
-        docker = DockerConfig.query.filter_by(id=1).first()
-        swarm = is_swarm_mode(docker)
-        secrets = get_secrets(docker) if swarm else []
+        docker = get_docker_config()
+        swarm = cached_lookup(docker, "swarm_mode", lambda: is_swarm_mode(docker))
+        secrets = cached_lookup(docker, "secret_list", lambda: get_secrets(docker)) if swarm else []
         data = [{"name": i["Name"], "id": i["Name"]} for i in secrets]
         return {"success": True, "data": data, "swarm_mode": swarm}
 
@@ -504,7 +623,7 @@ class SecretAPI(Resource):
             return {"success": False, "error": error}, 400
 
         # Get Docker config
-        docker = DockerConfig.query.filter_by(id=1).first()
+        docker = get_docker_config()
         if not docker:
             return {"success": False, "error": "Docker configuration not found"}, 500
 
@@ -525,6 +644,8 @@ class SecretAPI(Resource):
         if not success:
             return {"success": False, "error": "Failed to create secret. Check Docker logs."}, 500
 
+        clear_lookup_cache()
+
         # Audit logging (log name only, NOT value)
         user = get_current_user()
         username = user.name if user else "Unknown"
@@ -538,10 +659,10 @@ class SecretAPI(Resource):
         if not secret_id:
             return {"success": False, "error": "Secret ID is required"}, 400
 
-        if not re.match(r"^[a-zA-Z0-9_-]+$", secret_id):
+        if not _SECRET_ID_RE.match(secret_id):
             return {"success": False, "error": "Invalid secret ID format"}, 400
 
-        docker = DockerConfig.query.filter_by(id=1).first()
+        docker = get_docker_config()
         if not docker:
             return {"success": False, "error": "Docker configuration not found"}, 500
 
@@ -549,6 +670,7 @@ class SecretAPI(Resource):
         success = delete_secret(docker, secret_id)
 
         if success:
+            clear_lookup_cache()
             # Audit log (ID only - no need to fetch name)
             user = get_current_user()
             username = user.name if user else "Unknown"
@@ -574,7 +696,7 @@ class SecretBulkDeleteAPI(Resource):
 
     @admins_only
     def delete(self):
-        docker = DockerConfig.query.filter_by(id=1).first()
+        docker = get_docker_config()
         if not docker:
             return {"success": False, "error": "Docker configuration not found"}, 500
 
@@ -593,16 +715,23 @@ class SecretBulkDeleteAPI(Resource):
         failed_count = 0
         errors = []
 
-        for secret in all_secrets:
-            secret_id = secret["ID"]
-            secret_name = secret["Name"]
+        # Each delete is an independent Docker API round-trip; run them concurrently
+        with ThreadPoolExecutor(
+            max_workers=min(DOCKER_DELETE_MAX_WORKERS, len(all_secrets))
+        ) as pool:
+            results = list(
+                pool.map(lambda secret: delete_secret(docker, secret["ID"]), all_secrets)
+            )
 
-            success = delete_secret(docker, secret_id)
+        for secret, success in zip(all_secrets, results):
             if success:
                 deleted_count += 1
             else:
                 failed_count += 1
-                errors.append(f"Failed to delete '{secret_name}' (likely in use)")
+                errors.append(f"Failed to delete '{secret['Name']}' (likely in use)")
+
+        if deleted_count:
+            clear_lookup_cache()
 
         # Audit logging
         user = get_current_user()
@@ -640,31 +769,20 @@ class ImagePortsAPI(Resource):
             return {"success": False, "error": "Image name too long"}, 400
 
         # Validate Docker image name format to prevent SSRF attacks
-        # Pattern: [registry/][namespace/]name[:tag][@digest]
-        # Examples: nginx, nginx:latest, myregistry.com/user/image:v1.0
-        docker_image_pattern = re.compile(
-            r"^(?:(?:[a-z0-9]+(?:[._-][a-z0-9]+)*\.)*[a-z0-9]+(?:[._-][a-z0-9]+)*(?::[0-9]+)?/)?"
-            r"(?:[a-z0-9._-]+/)?"
-            r"[a-z0-9._-]+"
-            r"(?::[a-zA-Z0-9._-]+)?"
-            r"(?:@sha256:[a-f0-9]{64})?$",
-            re.IGNORECASE,
-        )
-
-        if not docker_image_pattern.match(image):
+        if not _DOCKER_IMAGE_RE.match(image):
             return {
                 "success": False,
                 "error": "Invalid Docker image name format",
             }, 400
 
-        docker = DockerConfig.query.filter_by(id=1).first()
+        docker = get_docker_config()
         if not docker:
             return {"success": False, "error": "Docker config not found"}, 404
 
         try:
+            # Image metadata is cached inside get_required_ports
             ports = get_required_ports(docker, image, challenge_ports=None)
             return {"success": True, "ports": ports}
         except Exception as e:
-            logging.error("Error in image_ports endpoint: %s: %s", type(e).__name__, e)
-            logging.error("Traceback: %s", traceback.format_exc())
+            logging.exception("Error in image_ports endpoint: %s: %s", type(e).__name__, e)
             return {"success": False, "error": "Failed to retrieve image port information"}, 500
@@ -8,8 +8,24 @@ behavior across the plugin.
 # Container lifecycle timeouts (in seconds)
 CONTAINER_STALE_TIMEOUT_SECONDS = 7200  # 2 hours - auto-cleanup threshold
 CONTAINER_REVERT_TIMEOUT_SECONDS = 300  # 5 minutes - minimum time before revert allowed
+STALE_CLEANUP_INTERVAL_SECONDS = 300  # 5 minutes - background sweep of stale containers
+DOCKER_DELETE_MAX_WORKERS = 16  # Concurrent Docker API deletes (kill-all, bulk secret delete)
+TRACKER_DELETE_CHUNK_SIZE = 500  # Max instance IDs per tracker DELETE ... IN (...) statement
 
 # Port assignment range for Docker containers/services
 PORT_ASSIGNMENT_MIN = 30000  # Minimum port for random assignment
 PORT_ASSIGNMENT_MAX = 60000  # Maximum port for random assignment
-MAX_PORT_ASSIGNMENT_ATTEMPTS = 100  # Maximum attempts to find available port before failing
+MAX_PORT_ASSIGNMENT_ATTEMPTS = 100  # Oversampling rounds before sampling free ports directly
+
+# Docker API lookup caching (in seconds)
+DOCKER_LOOKUP_CACHE_TTL_SECONDS = 60  # 1 minute - reuse slow-moving Docker API responses
+DOCKER_LOOKUP_REFRESH_INTERVAL_SECONDS = 30  # Background refresh of admin page lookups
+ADMIN_LOOKUP_IDLE_SECONDS = 600  # 10 minutes - stop refreshing admin lookups nobody has read
+SERVICE_SECRET_LOOKUP_TTL_SECONDS = 5  # Secrets read at deploy; short so outside changes show up
+IMAGE_METADATA_CACHE_TTL_SECONDS = 300  # 5 minutes - exposed ports read from image metadata
+
+# Docker API HTTP connections
+DOCKER_HTTP_POOL_SIZE = 32  # Keep-alive connections kept per Docker endpoint (>= delete workers)
+
+# Certificate upload handling
+CERT_UPLOAD_CHUNK_SIZE = 64 * 1024  # 64 KiB - bounded buffer when streaming uploads to disk
@@ -1,21 +1,43 @@
 from __future__ import annotations
 
-import hashlib
+import functools
 import json
 import logging
 from typing import TYPE_CHECKING
 
-from ..functions.general import _find_available_port, do_request, get_required_ports
+from ..functions.general import (
+    _find_available_ports,
+    _team_hash,
+    do_request,
+    get_required_ports,
+)
 
 # Type-only imports: keeps functions testable without SQLAlchemy initialization.
 # Runtime model access uses lazy imports inside individual functions.
 if TYPE_CHECKING:
     from ..models.models import DockerConfig
 
+# Characters in image references that are not valid in container names
+_IMAGE_NAME_TRANSLATION = str.maketrans({":": "_", "/": "_", ".": "_"})
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_image(image: str) -> str:
+    """Turn an image reference into a container-name-safe slug."""
+    return image.translate(_IMAGE_NAME_TRANSLATION)
+
+
+def _container_name(image: str, team: str) -> str:
+    """Build the deterministic container name for an image and team/user identifier."""
+    return f"{_sanitize_image(image)}_{_team_hash(team)}"
+
 
 def find_existing(docker: DockerConfig, name: str) -> str | None:
     """
-    Find existing Docker container by name.
+    Find existing Docker container by exact name.
+
+    Docker's name filter matches substrings, so results are narrowed locally to the
+    container whose name is exactly ``name``.
 
     Returns:
         Container ID if found, None otherwise
@@ -26,39 +48,34 @@ def find_existing(docker: DockerConfig, name: str) -> str | None:
         logging.error("Failed to contact Docker!")
         return None
 
-    if len(r.json()) == 1:
-        return r.json()[0]["Id"]
+    docker_name = f"/{name}"
+    return next((c["Id"] for c in r.json() if docker_name in c.get("Names", [])), None)
 
-    return None
 
-
-def _assign_container_ports(needed_ports: list[str], blocked_ports: list[int]) -> dict[str, dict]:
+def _assign_container_ports(
+    needed_ports: list[str], blocked_ports: set[int]
+) -> dict[str, list[dict[str, str]]]:
     """
     Assign random available ports from PORT_ASSIGNMENT_MIN-PORT_ASSIGNMENT_MAX range for containers.
 
     Args:
         needed_ports: List of port/protocol strings (e.g., ["80/tcp", "443/tcp"])
-        blocked_ports: List of ports already in use
+        blocked_ports: Set of ports already in use
 
     Returns:
-        Dictionary mapping port strings to empty dicts for Docker PortBindings
+        Docker HostConfig.PortBindings mapping each needed port to its assigned host port
     """
-    assigned_ports = {}
-
-    for _i in needed_ports:
-        port = _find_available_port(blocked_ports)
-        assigned_ports[f"{port}/tcp"] = {}
-
-    return assigned_ports
+    ports = _find_available_ports(blocked_ports, len(needed_ports))
+    return {needed: [{"HostPort": str(port)}] for needed, port in zip(needed_ports, ports)}
 
 
 def create_container(
     docker: DockerConfig,
     image: str,
     team: str,
-    portbl: list[int],
+    portbl: set[int],
     exposed_ports: str | None = None,
-) -> tuple[str, str] | tuple[None, None]:
+) -> tuple[str, dict] | tuple[None, None]:
     """
     Create a standalone Docker container for a challenge instance.
 
@@ -66,43 +83,29 @@ def create_container(
         docker: DockerConfig instance with API connection details
         image: Docker image name (e.g., "registry/image:tag")
         team: Team/user identifier for unique container naming
-        portbl: List of blocked ports to avoid conflicts
+        portbl: Set of blocked ports to avoid conflicts
         exposed_ports: Optional comma-separated port specs (e.g., "80/tcp,443/tcp")
 
     Returns:
-        Tuple of (container_id, container_name) on success.
+        Tuple of (container_id, creation payload dict) on success, (None, None) on failure.
     """
     needed_ports = get_required_ports(docker, image, exposed_ports)
-    # MD5 used for container naming only, not security
-    team = hashlib.md5(team.encode("utf-8"), usedforsecurity=False).hexdigest()[:10]
-    container_name = "{}_{}".format(
-        image.replace(":", "_").replace("/", "_").replace(".", "_"),
-        team,
-    )
+    container_name = _container_name(image, team)
 
     # Assign random available ports
-    assigned_ports = _assign_container_ports(needed_ports, portbl)
-
-    ports = {}
-    bindings = {}
-    tmp_ports = list(assigned_ports.keys())
-    for i in needed_ports:
-        ports[i] = {}
-        bindings[i] = [{"HostPort": tmp_ports.pop()}]
-    data = json.dumps(
-        {
-            "Image": image,
-            "ExposedPorts": ports,
-            "HostConfig": {"PortBindings": bindings},
-            "AutoRemove": True,
-        }
-    )
+    bindings = _assign_container_ports(needed_ports, portbl)
+    payload = {
+        "Image": image,
+        "ExposedPorts": {port: {} for port in bindings},
+        "HostConfig": {"PortBindings": bindings},
+        "AutoRemove": True,
+    }
 
     r = do_request(
         docker,
         url=f"/containers/create?name={container_name}",
         method="POST",
-        data=data,
+        data=json.dumps(payload),
     )
     if not r:
         return None, None
@@ -112,7 +115,7 @@ def create_container(
 
     do_request(docker, url=f"/containers/{instance_id}/start", method="POST")
 
-    return instance_id, data
+    return instance_id, payload
 
 
 def delete_container(docker: DockerConfig, instance_id: str) -> bool:
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
 import base64
+import functools
+import hashlib
 import json
 import logging
+import os
 import random
+import socket
+import threading
+import time
+import uuid
+from collections.abc import Mapping
+from concurrent.futures import Future
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import requests
+from CTFd.cache import cache
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout
+from urllib3.connection import HTTPConnection
 
 from ..constants import (
+    DOCKER_HTTP_POOL_SIZE,
+    DOCKER_LOOKUP_CACHE_TTL_SECONDS,
+    IMAGE_METADATA_CACHE_TTL_SECONDS,
     MAX_PORT_ASSIGNMENT_ATTEMPTS,
     PORT_ASSIGNMENT_MAX,
     PORT_ASSIGNMENT_MIN,
@@ -22,6 +38,41 @@ from ..constants import (
 if TYPE_CHECKING:
     from ..models.models import DockerChallengeTracker, DockerConfig
 
+_T = TypeVar("_T")
+
+# Short-lived cache for slow-moving Docker API lookups, keyed by endpoint fingerprint
+_lookup_cache: dict[tuple, tuple[float, Any]] = {}
+_lookup_cache_lock = threading.Lock()
+# Fetches in progress, so concurrent misses for the same key share one Docker API request
+_lookup_inflight: dict[tuple, Future] = {}
+# CTFd cache key holding the lookup cache generation shared by all worker processes
+_LOOKUP_GENERATION_KEY = "docker_challenges:lookup_generation"
+
+
+# urllib3's defaults already disable Nagle (TCP_NODELAY); keep them and add TCP keepalive
+_DOCKER_SOCKET_OPTIONS = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _DockerAdapter(HTTPAdapter):
+    """HTTPAdapter enabling TCP keepalive so idle pooled Docker connections are probed."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _DOCKER_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Read-only default headers shared by every do_request call that passes none
+_DEFAULT_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# Shared HTTP session so Docker API calls reuse TCP/TLS connections (keep-alive).
+# urllib3 keys its pools by scheme, host and TLS cert paths, so config changes get new pools.
+_docker_session = requests.Session()
+for _scheme in ("http://", "https://"):
+    _docker_session.mount(_scheme, _DockerAdapter(pool_maxsize=DOCKER_HTTP_POOL_SIZE))
+
 
 def _validate_tls_files(docker: DockerConfig) -> bool:
     """Check that all TLS certificate files exist on disk."""
@@ -36,10 +87,100 @@ def _validate_tls_files(docker: DockerConfig) -> bool:
     return True
 
 
+def _docker_fingerprint(docker: DockerConfig) -> tuple:
+    """Identify a Docker endpoint by hostname, TLS mode and certificate file versions."""
+    cert_versions = []
+    for cert_path in (docker.ca_cert, docker.client_cert, docker.client_key):
+        try:
+            cert_versions.append(os.stat(cert_path).st_mtime_ns if cert_path else None)
+        except OSError:
+            cert_versions.append(None)
+    return (docker.hostname, bool(docker.tls_enabled), tuple(cert_versions))
+
+
+def _lookup_generation() -> Any:
+    """Return the shared lookup cache generation; clear_lookup_cache() in any worker bumps it."""
+    return cache.get(_LOOKUP_GENERATION_KEY)
+
+
+def cached_lookup(
+    docker: DockerConfig,
+    name: str,
+    fetch: Callable[[], _T],
+    ttl: float = DOCKER_LOOKUP_CACHE_TTL_SECONDS,
+    force: bool = False,
+) -> _T:
+    """
+    Return the result of fetch(), reusing it for ttl seconds per Docker endpoint.
+
+    Concurrent misses for the same key wait for a single in-flight fetch() instead of
+    each issuing their own Docker API request.
+
+    Args:
+        docker: DockerConfig instance the lookup is made against
+        name: Lookup identifier, unique per kind of request and its arguments
+        fetch: Zero-argument callable performing the actual Docker API request
+        ttl: Seconds a successful result stays valid
+        force: If True, skip any cached value and refresh it from fetch()
+
+    Returns:
+        The cached or freshly fetched value. Empty/falsy results are not cached
+        so that transient Docker API failures are retried on the next call.
+    """
+    key = (name, _lookup_generation(), *_docker_fingerprint(docker))
+    now = time.monotonic()
+    with _lookup_cache_lock:
+        entry = None if force else _lookup_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        pending = _lookup_inflight.get(key)
+        if pending is None:
+            future = _lookup_inflight[key] = Future()
+    if pending is not None:
+        return pending.result()
+
+    try:
+        value = fetch()
+        if value:
+            with _lookup_cache_lock:
+                for stale_key in [k for k, (expiry, _) in _lookup_cache.items() if expiry <= now]:
+                    del _lookup_cache[stale_key]
+                _lookup_cache[key] = (now + ttl, value)
+    except Exception as err:
+        future.set_exception(err)
+        raise
+    except BaseException:
+        # gevent.Timeout, GreenletExit, KeyboardInterrupt: release waiters instead of hanging them
+        future.cancel()
+        raise
+    else:
+        future.set_result(value)
+    finally:
+        with _lookup_cache_lock:
+            _lookup_inflight.pop(key, None)
+    return value
+
+
+def close_docker_connections() -> None:
+    """Drop pooled Docker API connections (e.g. after the Docker config changes)."""
+    _docker_session.close()
+
+
+def clear_lookup_cache() -> None:
+    """Drop all cached Docker API lookups (e.g. after the Docker config changes).
+
+    Also bumps the generation stored in CTFd's cache so that other worker processes
+    stop serving their cached values too.
+    """
+    cache.set(_LOOKUP_GENERATION_KEY, uuid.uuid4().hex, timeout=0)
+    with _lookup_cache_lock:
+        _lookup_cache.clear()
+
+
 def do_request(
     docker: DockerConfig,
     url: str,
-    headers: dict[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
     method: str = "GET",
     data: dict | str | None = None,
 ) -> Response | None:
@@ -67,7 +208,7 @@ def do_request(
         return None
 
     if not headers:
-        headers = {"Content-Type": "application/json"}
+        headers = _DEFAULT_HEADERS
 
     request_args = {
         "url": f"{base}{url}",
@@ -85,12 +226,12 @@ def do_request(
         request_args["cert"] = (docker.client_cert, docker.client_key)
         request_args["verify"] = docker.ca_cert
 
-    logging.info("Request to Docker: %s %s", request_args["method"], request_args["url"])
+    logging.debug("Request to Docker: %s %s", request_args["method"], request_args["url"])
 
     resp = None
     try:
         # Timeout is set in request_args above
-        resp = requests.request(**request_args)
+        resp = _docker_session.request(**request_args)
     except ConnectionError:
         logging.error("Failed to establish a new connection. Connection refused.")
     except Timeout:
@@ -121,26 +262,28 @@ def get_repositories(
     if not r:
         return []
 
-    # Convert repos to list if it's a comma-separated string
-    repos_list: list[str] | None = None
+    # Convert repos to a set if it's a comma-separated string
+    repos_set: set[str] | None = None
     if repos:
-        repos_list = repos.split(",") if isinstance(repos, str) else repos
+        repos_set = set(repos.split(",") if isinstance(repos, str) else repos)
 
-    result = []
+    result: set[str] = set()
     for image in r.json():
         repo_tags = image.get("RepoTags")
         if not repo_tags:
             continue
-        image_name, _ = repo_tags[0].split(":")
+        # Strip only a trailing tag: the colon in "registry:5000/app" is a registry port
+        image_name, sep, tag = repo_tags[0].rpartition(":")
+        if not sep or "/" in tag:
+            image_name = repo_tags[0]
         if image_name == "<none>":
             continue
 
-        if repos_list and image_name not in repos_list:
+        if repos_set and image_name not in repos_set:
             continue
-        else:
-            result.append(image_name if not tags else repo_tags[0])
+        result.add(repo_tags[0] if tags else image_name)
 
-    return list(set(result))
+    return list(result)
 
 
 def get_docker_info(docker: DockerConfig) -> str:
@@ -164,11 +307,8 @@ def get_docker_info(docker: DockerConfig) -> str:
     if not components:
         return "Failed to find information required in response."
 
-    output = "Docker versions:\n"
-    for component in components:
-        output += f"{component['Name']}: {component['Version']}\n"
-
-    return output
+    lines = (f"{component['Name']}: {component['Version']}\n" for component in components)
+    return "Docker versions:\n" + "".join(lines)
 
 
 def is_swarm_mode(docker: DockerConfig) -> bool:
@@ -307,85 +447,100 @@ def delete_secret(docker: DockerConfig, secret_id: str) -> bool:
         return False
 
 
-def _find_available_port(blocked_ports: list[int]) -> int:
+@functools.lru_cache(maxsize=4096)
+def _team_hash(team: str) -> str:
+    """Short stable hash of a team/user identifier for Docker resource names."""
+    # MD5 used for resource naming only, not security
+    return hashlib.md5(team.encode("utf-8"), usedforsecurity=False).hexdigest()[:10]
+
+
+def _find_available_ports(blocked_ports: set[int], count: int) -> list[int]:
     """
-    Find a random available port not in the blocked list.
+    Pick distinct random ports that are not in the blocked set.
 
     Args:
-        blocked_ports: List of ports already in use
+        blocked_ports: Set of ports already in use
+        count: Number of ports needed
 
     Returns:
-        An available port number
+        List of count distinct available port numbers
 
     Raises:
-        RuntimeError: If no available port found after MAX_PORT_ASSIGNMENT_ATTEMPTS
+        RuntimeError: If fewer than count ports in the range are free
     """
-    for _attempt in range(MAX_PORT_ASSIGNMENT_ATTEMPTS):
-        # random.choice used for port assignment, not cryptographic purposes
-        candidate_port = random.choice(range(PORT_ASSIGNMENT_MIN, PORT_ASSIGNMENT_MAX))
-        if candidate_port not in blocked_ports:
-            return candidate_port
-
-    raise RuntimeError(
-        f"Failed to find available port after {MAX_PORT_ASSIGNMENT_ATTEMPTS} attempts. "
-        f"Port range {PORT_ASSIGNMENT_MIN}-{PORT_ASSIGNMENT_MAX} may be exhausted."
-    )
-
-
-def _extract_container_ports(containers_json: list[dict]) -> list[int]:
+    port_range = range(PORT_ASSIGNMENT_MIN, PORT_ASSIGNMENT_MAX)
+    # random.sample used for port assignment, not cryptographic purposes
+    if len(blocked_ports) * 2 < len(port_range):
+        # Mostly free: oversample distinct candidates and drop the few that are blocked
+        sample_size = min(len(port_range), count * 2)
+        for _attempt in range(MAX_PORT_ASSIGNMENT_ATTEMPTS):
+            picked = [p for p in random.sample(port_range, sample_size) if p not in blocked_ports]
+            if len(picked) >= count:
+                return picked[:count]
+
+    # Crowded range: sample directly from the ports that are actually free
+    available = [port for port in port_range if port not in blocked_ports]
+    if len(available) < count:
+        raise RuntimeError(
+            f"Not enough free ports: {count} needed, {len(available)} available in "
+            f"{PORT_ASSIGNMENT_MIN}-{PORT_ASSIGNMENT_MAX}."
+        )
+    return random.sample(available, count)
+
+
+def _extract_container_ports(containers_json: list[dict]) -> set[int]:
     """Extract public ports from container list."""
-    result = []
-    for container in containers_json:
-        ports = container.get("Ports")
-        if not ports:
-            continue
-
-        for port in ports:
-            if port.get("PublicPort", 0):
-                result.append(port["PublicPort"])
-
-    return result
+    return {
+        port["PublicPort"]
+        for container in containers_json
+        for port in container.get("Ports") or ()
+        if port.get("PublicPort", 0)
+    }
 
 
-def _extract_service_ports(services_json: list[dict]) -> list[int]:
+def _extract_service_ports(services_json: list[dict]) -> set[int]:
     """Extract published ports from service list."""
-    result = []
-    for service in services_json:
-        endpoint = service.get("Endpoint", {}).get("Spec")
-        if not endpoint:
-            continue
-
-        for port in endpoint.get("Ports", []):
-            if pub_port := port.get("PublishedPort"):
-                result.append(pub_port)
-
-    return result
+    return {
+        port["PublishedPort"]
+        for service in services_json
+        for port in (service.get("Endpoint", {}).get("Spec") or {}).get("Ports", [])
+        if port.get("PublishedPort")
+    }
 
 
-def get_unavailable_ports(docker: DockerConfig) -> list[int]:
-    """Get list of ports already in use by containers and services."""
+def get_unavailable_ports(docker: DockerConfig) -> set[int]:
+    """Get set of ports already in use by containers and services."""
     # Get container ports
     r = do_request(docker, "/containers/json?all=1")
     if not r:
         logging.error("Unable to get list of ports that are unavailable (containers)!")
-        return []
+        return set()
 
     result = _extract_container_ports(r.json())
 
     # Get service ports
     r = do_request(docker, "/services?all=1")
+    # Standalone Docker answers 503 ("This node is not a swarm manager."): no services
+    if r is not None and r.status_code == 503:
+        return result
     if not r:
         logging.error("Unable to get list of ports that are unavailable (services)!")
         return result
 
-    rj = r.json()
-    if isinstance(rj, dict) and "This node is not a swarm manager." in rj.get("message"):
-        return result
-
-    result.extend(_extract_service_ports(rj))
+    result |= _extract_service_ports(r.json())
     return result
 
 
+def _fetch_image_exposed_ports(docker: DockerConfig, image: str) -> list[str]:
+    """Read the ExposedPorts keys from an image's metadata."""
+    r = do_request(docker, f"/images/{image}/json?all=1")
+    if r and hasattr(r, "json"):
+        exposed_ports = r.json().get("Config", {}).get("ExposedPorts")
+        if exposed_ports:
+            return list(exposed_ports.keys())
+    return []
+
+
 def get_required_ports(
     docker: DockerConfig, image: str, challenge_ports: str | None = None
 ) -> list[str]:
@@ -400,15 +555,15 @@ def get_required_ports(
     Returns:
         List of port specifications (e.g., ["80/tcp", "443/tcp"])
     """
-    ports = set()
-
-    # Get ports from image metadata
-    r = do_request(docker, f"/images/{image}/json?all=1")
-    if r and hasattr(r, "json"):
-        config = r.json().get("Config", {})
-        exposed_ports = config.get("ExposedPorts")
-        if exposed_ports:
-            ports.update(exposed_ports.keys())
+    # Get ports from image metadata (only the port keys are cached, not the full JSON)
+    ports = set(
+        cached_lookup(
+            docker,
+            f"image_exposed_ports:{image}",
+            lambda: _fetch_image_exposed_ports(docker, image),
+            ttl=IMAGE_METADATA_CACHE_TTL_SECONDS,
+        )
+    )
 
     # Merge with challenge-configured ports
     if challenge_ports and challenge_ports.strip():
@@ -496,7 +651,9 @@ def cleanup_container_on_solve(
     container = get_user_container(user, team, challenge, is_teams=is_teams)
     if container:
         if delete_func(docker, container.instance_id):
-            _Tracker.query.filter_by(instance_id=container.instance_id).delete()
+            _Tracker.query.filter_by(instance_id=container.instance_id).delete(
+                synchronize_session=False
+            )
         else:
             logging.warning(
                 "Failed to delete container %s on solve for challenge %s",
@@ -1,32 +1,39 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 from typing import TYPE_CHECKING
 
-from ..functions.general import _find_available_port, do_request, get_required_ports, get_secrets
+from ..constants import SERVICE_SECRET_LOOKUP_TTL_SECONDS
+from ..functions.general import (
+    _find_available_ports,
+    _team_hash,
+    cached_lookup,
+    do_request,
+    get_required_ports,
+    get_secrets,
+)
 
 # Type-only imports: keeps functions testable without SQLAlchemy initialization.
 # Runtime model access uses lazy imports inside individual functions.
 if TYPE_CHECKING:
-    from ..models.models import DockerConfig, DockerServiceChallenge
+    from ..models.models import DockerConfig
 
 
-def _assign_service_ports(needed_ports: list, blocked_ports: list) -> list:
+def _assign_service_ports(needed_ports: list, blocked_ports: set[int]) -> list:
     """
     Assign random available ports from PORT_ASSIGNMENT_MIN-PORT_ASSIGNMENT_MAX range for service endpoints.
 
     Args:
         needed_ports: List of port/protocol strings (e.g., ["80/tcp", "443/tcp"])
-        blocked_ports: List of ports already in use
+        blocked_ports: Set of ports already in use
 
     Returns:
         List of port binding dictionaries for Docker service EndpointSpec
     """
     assigned_ports = []
-    for port_spec in needed_ports:
-        port = _find_available_port(blocked_ports)
+    ports = _find_available_ports(blocked_ports, len(needed_ports))
+    for port_spec, port in zip(needed_ports, ports):
         port_dict = {
             "PublishedPort": port,
             "PublishMode": "ingress",
@@ -45,38 +52,32 @@ def _parse_docker_secrets(raw: str | None) -> list[dict]:
     return json.loads(raw)
 
 
-def _build_secrets_list(challenge: DockerServiceChallenge, docker: DockerConfig) -> list:
+def _build_secrets_list(secret_configs: list[dict], all_secrets: list[dict]) -> list:
     """
     Build Docker secrets list with file permissions for service configuration.
 
     Args:
-        challenge: DockerServiceChallenge instance with secret IDs and permissions
-        docker: DockerConfig for fetching available secrets
+        secret_configs: Parsed challenge secrets ({id, protected} dicts)
+        all_secrets: Secrets available in the swarm, as returned by get_secrets()
 
     Returns:
         List of secret mount dictionaries for Docker service TaskTemplate
     """
-    all_secrets = get_secrets(docker)
     secrets_list = []
-    secret_configs = _parse_docker_secrets(challenge.docker_secrets)
-
+    by_name = {secret["Name"]: secret for secret in all_secrets}
+    by_id = {secret["ID"]: secret for secret in all_secrets}
     for config in secret_configs:
         secret_id = config["id"]  # Now expected to be a Name (legacy entries may be Swarm IDs)
         permissions = 0o600 if config.get("protected", False) else 0o777
 
-        matched_secret = None
-        for secret in all_secrets:
-            if secret_id == secret["Name"]:  # Primary: match by Name
-                matched_secret = secret
-                break
-            if secret_id == secret["ID"]:  # Fallback: match legacy Swarm IDs
-                matched_secret = secret
-                logging.warning(
-                    "Secret '%s' matched by Swarm ID (legacy). "
-                    "Re-save the challenge to use name-based matching.",
-                    secret["Name"],
-                )
-                break
+        # Primary: match by Name; fallback: match legacy Swarm IDs
+        matched_secret = by_name.get(secret_id)
+        if matched_secret is None and (matched_secret := by_id.get(secret_id)):
+            logging.warning(
+                "Secret '%s' matched by Swarm ID (legacy). "
+                "Re-save the challenge to use name-based matching.",
+                matched_secret["Name"],
+            )
 
         if matched_secret:
             secrets_list.append(
@@ -101,8 +102,8 @@ def _build_secrets_list(challenge: DockerServiceChallenge, docker: DockerConfig)
 
 
 def create_service(
-    docker: DockerConfig, challenge_id: int, image: str, team: str, portbl: list
-) -> tuple[str | None, str | None]:
+    docker: DockerConfig, challenge_id: int, image: str, team: str, portbl: set[int]
+) -> tuple[str | None, dict | None]:
     """
     Create a Docker Swarm service for a challenge instance.
 
@@ -111,48 +112,59 @@ def create_service(
         challenge_id: Database ID of the challenge
         image: Docker image name (e.g., "registry/image:tag")
         team: Team identifier for unique service naming
-        portbl: List of blocked ports to avoid conflicts
+        portbl: Set of blocked ports to avoid conflicts
 
     Returns:
-        Tuple of (instance_id, service_data) or (None, None) on failure
+        Tuple of (instance_id, service creation payload dict) or (None, None) on failure
     """
     # Get challenge configuration
     from ..models.models import DockerServiceChallenge as _ServiceChallenge
 
     challenge = _ServiceChallenge.query.filter_by(id=challenge_id).first()
     exposed_ports = challenge.exposed_ports if challenge else None
+    secret_configs = _parse_docker_secrets(challenge.docker_secrets) if challenge else []
+
     needed_ports = get_required_ports(docker, image, exposed_ports)
+    # Swarm secrets, only when needed; a short-lived key so secrets changed outside the
+    # plugin are picked up, while concurrent deploys still share one /secrets request
+    all_secrets = (
+        cached_lookup(
+            docker,
+            "service_secret_list",
+            lambda: get_secrets(docker),
+            ttl=SERVICE_SECRET_LOOKUP_TTL_SECONDS,
+        )
+        if secret_configs
+        else []
+    )
 
     # Generate unique service name
-    # MD5 used for service naming only, not security
-    team_hash = hashlib.md5(team.encode("utf-8"), usedforsecurity=False).hexdigest()[:10]
-    service_name = f"svc_{image.split(':')[1]}{team_hash}"
+    service_name = f"svc_{image.split(':')[1]}{_team_hash(team)}"
 
     # Assign available ports and build secrets list
     assigned_ports = _assign_service_ports(needed_ports, portbl)
-    secrets_list = _build_secrets_list(challenge, docker)
+    secrets_list = _build_secrets_list(secret_configs, all_secrets)
 
     # Build service creation request
-    data = json.dumps(
-        {
-            "Name": service_name,
-            "TaskTemplate": {"ContainerSpec": {"Image": image, "Secrets": secrets_list}},
-            "EndpointSpec": {"Mode": "vip", "Ports": assigned_ports},
-        }
-    )
+    payload = {
+        "Name": service_name,
+        "TaskTemplate": {"ContainerSpec": {"Image": image, "Secrets": secrets_list}},
+        "EndpointSpec": {"Mode": "vip", "Ports": assigned_ports},
+    }
 
     # Create service and handle response
-    r = do_request(docker, url="/services/create", method="POST", data=data)
+    r = do_request(docker, url="/services/create", method="POST", data=json.dumps(payload))
     if not r:
         return None, None
 
-    instance_id = r.json().get("ID")
+    body = r.json()
+    instance_id = body.get("ID")
     if not instance_id:
         logging.error("Unable to create service %s with image %s", service_name, image)
-        logging.error("Error: %s", r.json())
+        logging.error("Error: %s", body)
         return None, None
 
-    return instance_id, data
+    return instance_id, payload
 
 
 def delete_service(docker: DockerConfig, instance_id: str) -> bool:
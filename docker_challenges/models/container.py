@@ -92,7 +92,9 @@ class DockerChallengeType(BaseChallenge):
                     "No DockerConfig found; skipping Docker deletion for container %s",
                     entry.instance_id,
                 )
-        DockerChallengeTracker.query.filter_by(challenge_id=challenge.id).delete()
+        DockerChallengeTracker.query.filter_by(challenge_id=challenge.id).delete(
+            synchronize_session=False
+        )
         Fails.query.filter_by(challenge_id=challenge.id).delete()
         Solves.query.filter_by(challenge_id=challenge.id).delete()
         Flags.query.filter_by(challenge_id=challenge.id).delete()
@@ -25,13 +25,21 @@ class DockerChallengeTracker(db.Model):
     Docker Container Tracker. This model stores the users/teams active docker containers.
     """
 
+    # Composite indexes for the owner + challenge and owner + age lookups on the request path
+    __table_args__: ClassVar[tuple] = (
+        db.Index("ix_tracker_team_challenge", "team_id", "challenge_id", "docker_image"),
+        db.Index("ix_tracker_user_challenge", "user_id", "challenge_id", "docker_image"),
+        db.Index("ix_tracker_team_timestamp", "team_id", "timestamp"),
+        db.Index("ix_tracker_user_timestamp", "user_id", "timestamp"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     team_id = db.Column("team_id", db.String(64), index=True)
     user_id = db.Column("user_id", db.String(64), index=True)
     challenge_id = db.Column("challenge_id", db.Integer, index=True)
     docker_image = db.Column("docker_image", db.String(64), index=True)
-    timestamp = db.Column("timestamp", db.Integer, index=True)
-    revert_time = db.Column("revert_time", db.Integer, index=True)
+    timestamp = db.Column("timestamp", db.BigInteger, index=True)
+    revert_time = db.Column("revert_time", db.BigInteger, index=True)
     instance_id = db.Column("instance_id", db.String(128), index=True)
     ports = db.Column("ports", db.String(128), index=True)
     host = db.Column("host", db.String(128), index=True)
@@ -18,6 +18,7 @@ from tests.stubs import ctfd_stubs
 _stub_modules = {
     "CTFd": MagicMock(),
     "CTFd.api": MagicMock(),
+    "CTFd.cache": MagicMock(),
     "CTFd.models": ctfd_stubs,
     "CTFd.forms": ctfd_stubs,
     "CTFd.forms.fields": ctfd_stubs,
@@ -69,7 +70,7 @@ if "wtforms" not in sys.modules:
     _wtforms = MagicMock()
     sys.modules["wtforms"] = _wtforms
 
-# Need sqlalchemy for __init__.py
+# Need sqlalchemy for __init__.py and api.py
 if "sqlalchemy" not in sys.modules:
     _sqlalchemy = MagicMock()
     sys.modules["sqlalchemy"] = _sqlalchemy
@@ -77,11 +78,23 @@ if "sqlalchemy.exc" not in sys.modules:
     _sqlalchemy_exc = MagicMock()
     _sqlalchemy_exc.InternalError = type("InternalError", (Exception,), {})
     sys.modules["sqlalchemy.exc"] = _sqlalchemy_exc
+if "sqlalchemy.orm" not in sys.modules:
+    sys.modules["sqlalchemy.orm"] = MagicMock()
 
 # Need flask for __init__.py
 if "flask" not in sys.modules:
+
+    class _Blueprint:
+        """Stub for flask.Blueprint whose route() decorator leaves views unchanged."""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def route(self, *args, **kwargs):
+            return lambda f: f
+
     _flask = MagicMock()
-    _flask.Blueprint = MagicMock
+    _flask.Blueprint = _Blueprint
     _flask.render_template = MagicMock()
     _flask.request = MagicMock()
     sys.modules["flask"] = _flask
@@ -101,6 +114,16 @@ def _reset_ctfd_stubs():
             mod.reset_mock()
 
 
+@pytest.fixture(autouse=True)
+def _clear_docker_lookup_cache():
+    """Keep cached Docker API lookups from leaking between tests."""
+    from docker_challenges.functions.general import clear_lookup_cache
+
+    clear_lookup_cache()
+    yield
+    clear_lookup_cache()
+
+
 # ---------------------------------------------------------------------------
 # Shared Fixtures
 # ---------------------------------------------------------------------------
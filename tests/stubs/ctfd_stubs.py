@@ -9,13 +9,15 @@ class _Query:
         return self
     def filter(self, *args):
         return self
+    def with_entities(self, *args):
+        return self
     def first(self):
         return None
     def first_or_404(self):
         return None
     def all(self):
         return []
-    def delete(self):
+    def delete(self, synchronize_session=None):
         pass
     def yield_per(self, n):
         return iter([])
@@ -37,6 +39,8 @@ class _Column:
         return True
     def __ge__(self, other):
         return True
+    def in_(self, other):
+        return True
 
 
 class _DB:
@@ -44,12 +48,17 @@ class _DB:
     Model = _ModelMeta("Model", (), {})
     Column = _Column
     Integer = "Integer"
+    BigInteger = "BigInteger"
     String = lambda self=None, *a, **kw: "String"
     Boolean = "Boolean"
     Text = "Text"
     ForeignKey = lambda self=None, *a, **kw: None
     session = MagicMock()
 
+    @staticmethod
+    def Index(*args, **kwargs):  # noqa: N802
+        return None
+
 
 db = _DB()
 
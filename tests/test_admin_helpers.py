@@ -0,0 +1,430 @@
+"""Tests for admin page helper functions from docker_challenges/__init__.py.
+
+These tests validate:
+- _safe_unlink: Certificate file cleanup
+- _clear_cert: Certificate file and reference cleanup
+- _claim_stale_sweep: Cross-process claim of the background stale sweep
+- _run_stale_sweep: One background sweep, skipped when another worker holds the claim
+- _widen_tracker_time_columns: INTEGER -> BIGINT upgrade of tracker time columns
+- _start_background_worker: Per-process, per-app start of daemon worker threads
+- _ensure_background_workers: before_request hook that starts both workers
+- _refresh_active_admin_lookups: Background refresh of recently read admin lookups
+- _refresh_admin_lookups: Refresher loop, including the idle cutoff
+- _cacheable_response: Revalidated (no-cache + ETag) admin page responses
+
+Note: CTFd stubs are injected by conftest.py at module scope before test collection.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from docker_challenges import (
+    _admin_lookup,
+    _cacheable_response,
+    _claim_stale_sweep,
+    _clear_cert,
+    _ensure_background_workers,
+    _refresh_active_admin_lookups,
+    _refresh_admin_lookups,
+    _run_stale_sweep,
+    _safe_unlink,
+    _start_background_worker,
+    _widen_tracker_time_columns,
+)
+from docker_challenges.constants import (
+    ADMIN_LOOKUP_IDLE_SECONDS,
+    DOCKER_LOOKUP_REFRESH_INTERVAL_SECONDS,
+)
+
+
+# ============================================================================
+# Tests for _safe_unlink
+# ============================================================================
+class TestSafeUnlink:
+    """Test suite for _safe_unlink helper function."""
+
+    @pytest.mark.light
+    def test_removes_existing_file(self, tmp_path):
+        """Existing certificate file is deleted."""
+        cert = tmp_path / "ca.pem"
+        cert.write_text("cert")
+
+        _safe_unlink(str(cert))
+
+        assert not cert.exists()
+
+    @pytest.mark.light
+    def test_missing_file_is_ignored(self, tmp_path):
+        """Already missing file does not raise."""
+        _safe_unlink(str(tmp_path / "missing.pem"))
+
+    @pytest.mark.light
+    def test_other_os_errors_are_logged(self, tmp_path):
+        """OSErrors other than FileNotFoundError are logged, not raised."""
+        with (
+            patch("docker_challenges.os.unlink", side_effect=PermissionError("denied")),
+            patch("docker_challenges.logging.warning") as mock_warning,
+        ):
+            _safe_unlink(str(tmp_path / "ca.pem"))
+
+        mock_warning.assert_called_once()
+
+
+# ============================================================================
+# Tests for _clear_cert
+# ============================================================================
+class TestClearCert:
+    """Test suite for _clear_cert helper function."""
+
+    @pytest.mark.light
+    def test_deletes_file_and_clears_attribute(self, tmp_path):
+        """Stored certificate is removed from disk and the config."""
+        cert = tmp_path / "client.pem"
+        cert.write_text("cert")
+        config = MagicMock(client_cert=str(cert))
+
+        _clear_cert(config, "client_cert")
+
+        assert not cert.exists()
+        assert config.client_cert is None
+
+    @pytest.mark.light
+    def test_unset_attribute_skips_unlink(self):
+        """No file deletion is attempted when no certificate is stored."""
+        config = MagicMock(ca_cert=None)
+
+        with patch("docker_challenges._safe_unlink") as mock_unlink:
+            _clear_cert(config, "ca_cert")
+
+        mock_unlink.assert_not_called()
+        assert config.ca_cert is None
+
+
+# ============================================================================
+# Tests for _widen_tracker_time_columns
+# ============================================================================
+class _FakeBigInteger:
+    """Stand-in for sqlalchemy.BigInteger, which is mocked in the test environment."""
+
+
+class TestWidenTrackerTimeColumns:
+    """Test suite for _widen_tracker_time_columns helper function."""
+
+    @staticmethod
+    def _app(dialect: str) -> MagicMock:
+        app = MagicMock()
+        app.db.engine.dialect.name = dialect
+        app.db.engine.dialect.identifier_preparer.quote = lambda name: f"`{name}`"
+        return app
+
+    @pytest.mark.light
+    @patch("docker_challenges.text", side_effect=lambda sql: sql)
+    @patch("docker_challenges.BigInteger", _FakeBigInteger)
+    @patch(
+        "docker_challenges.DockerChallengeTracker.__table__",
+        SimpleNamespace(name="docker_challenge_tracker"),
+        create=True,
+    )
+    @patch("docker_challenges.inspect")
+    def test_only_narrow_columns_are_altered(self, mock_inspect, _mock_text):
+        """INTEGER time columns are widened; columns already BIGINT are left alone."""
+        app = self._app("mysql")
+        mock_inspect.return_value.get_columns.return_value = [
+            {"name": "timestamp", "type": object()},
+            {"name": "revert_time", "type": _FakeBigInteger()},
+        ]
+
+        _widen_tracker_time_columns(app)
+
+        connection = app.db.engine.begin.return_value.__enter__.return_value
+        connection.execute.assert_called_once_with(
+            "ALTER TABLE `docker_challenge_tracker` MODIFY `timestamp` BIGINT"
+        )
+
+    @pytest.mark.light
+    @patch("docker_challenges.inspect")
+    def test_sqlite_is_skipped(self, mock_inspect):
+        """SQLite needs no migration and is not inspected."""
+        app = self._app("sqlite")
+
+        _widen_tracker_time_columns(app)
+
+        mock_inspect.assert_not_called()
+        app.db.engine.begin.assert_not_called()
+
+
+# ============================================================================
+# Tests for _claim_stale_sweep
+# ============================================================================
+class TestClaimStaleSweep:
+    """Test suite for _claim_stale_sweep helper function."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.cache")
+    def test_claim_succeeds_when_key_absent(self, mock_cache):
+        """The first worker to add the shared key runs the sweep."""
+        mock_cache.add.return_value = True
+
+        assert _claim_stale_sweep() is True
+        key, _value = mock_cache.add.call_args.args
+        assert key == "docker_challenges:stale_sweep"
+
+    @pytest.mark.light
+    @patch("docker_challenges.cache")
+    def test_claim_fails_when_already_claimed(self, mock_cache):
+        """Other workers skip the interval while the key is held."""
+        mock_cache.add.return_value = False
+
+        assert _claim_stale_sweep() is False
+
+
+# ============================================================================
+# Tests for _run_stale_sweep
+# ============================================================================
+class TestRunStaleSweep:
+    """Test suite for _run_stale_sweep helper function."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.cleanup_stale_containers")
+    @patch("docker_challenges.get_docker_config")
+    @patch("docker_challenges._claim_stale_sweep", return_value=True)
+    def test_claimed_interval_sweeps_all_owners(self, _mock_claim, mock_get_config, mock_cleanup):
+        """The worker holding the claim cleans up stale containers for every owner."""
+        _run_stale_sweep(MagicMock())
+
+        mock_cleanup.assert_called_once_with(mock_get_config.return_value)
+
+    @pytest.mark.light
+    @patch("docker_challenges.cleanup_stale_containers")
+    @patch("docker_challenges.get_docker_config")
+    @patch("docker_challenges._claim_stale_sweep", return_value=False)
+    def test_unclaimed_interval_is_skipped(self, _mock_claim, mock_get_config, mock_cleanup):
+        """Workers that lose the claim neither load the config nor touch Docker."""
+        _run_stale_sweep(MagicMock())
+
+        mock_get_config.assert_not_called()
+        mock_cleanup.assert_not_called()
+
+    @pytest.mark.light
+    @patch("docker_challenges.cleanup_stale_containers")
+    @patch("docker_challenges.get_docker_config")
+    @patch("docker_challenges._claim_stale_sweep", return_value=True)
+    def test_unconfigured_docker_is_skipped(self, _mock_claim, mock_get_config, mock_cleanup):
+        """Without a Docker hostname there is nothing to sweep."""
+        mock_get_config.return_value = MagicMock(hostname="")
+
+        _run_stale_sweep(MagicMock())
+
+        mock_cleanup.assert_not_called()
+
+
+# ============================================================================
+# Tests for _start_background_worker
+# ============================================================================
+class TestStartBackgroundWorker:
+    """Test suite for _start_background_worker helper function."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.threading.Thread")
+    def test_running_worker_is_not_started_twice(self, mock_thread):
+        """Later requests in the same process reuse the live thread."""
+        app = SimpleNamespace(extensions={})
+        mock_thread.return_value.is_alive.return_value = True
+
+        _start_background_worker(app, MagicMock(), "worker")
+        _start_background_worker(app, MagicMock(), "worker")
+
+        mock_thread.return_value.start.assert_called_once()
+
+    @pytest.mark.light
+    @patch("docker_challenges.threading.Thread")
+    def test_dead_worker_is_restarted(self, mock_thread):
+        """A thread that has died (e.g. lost at fork) is replaced."""
+        app = SimpleNamespace(extensions={})
+        mock_thread.return_value.is_alive.return_value = False
+
+        _start_background_worker(app, MagicMock(), "worker")
+        _start_background_worker(app, MagicMock(), "worker")
+
+        assert mock_thread.return_value.start.call_count == 2
+
+    @pytest.mark.light
+    @patch("docker_challenges.threading.Thread")
+    def test_forked_process_starts_its_own_worker(self, mock_thread):
+        """A registry copied from a --preload master does not count for the child process."""
+        app = SimpleNamespace(extensions={})
+        mock_thread.return_value.is_alive.return_value = True
+
+        with patch("docker_challenges.os.getpid", return_value=100):
+            _start_background_worker(app, MagicMock(), "worker")
+        with patch("docker_challenges.os.getpid", return_value=101):
+            _start_background_worker(app, MagicMock(), "worker")
+
+        assert mock_thread.return_value.start.call_count == 2
+
+    @pytest.mark.light
+    @patch("docker_challenges.threading.Thread")
+    def test_workers_are_tracked_per_app(self, mock_thread):
+        """Each app object gets its own worker bound to it."""
+        mock_thread.return_value.is_alive.return_value = True
+        first, second = SimpleNamespace(extensions={}), SimpleNamespace(extensions={})
+
+        _start_background_worker(first, MagicMock(), "worker")
+        _start_background_worker(second, MagicMock(), "worker")
+
+        assert [c.kwargs["args"] for c in mock_thread.call_args_list] == [(first,), (second,)]
+
+
+# ============================================================================
+# Tests for _ensure_background_workers
+# ============================================================================
+class TestEnsureBackgroundWorkers:
+    """Test suite for the _ensure_background_workers before_request hook."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.threading.Thread")
+    @patch("docker_challenges.current_app")
+    def test_starts_sweep_and_refresher(self, mock_current_app, mock_thread):
+        """The hook starts the stale sweep and the lookup refresher for the current app."""
+        app = SimpleNamespace(extensions={})
+        mock_current_app._get_current_object.return_value = app
+        mock_thread.return_value.is_alive.return_value = True
+
+        _ensure_background_workers()
+        _ensure_background_workers()
+
+        names = [c.kwargs["name"] for c in mock_thread.call_args_list]
+        assert names == ["docker-stale-cleanup", "docker-lookup-refresher"]
+        assert all(c.kwargs["args"] == (app,) for c in mock_thread.call_args_list)
+        assert mock_thread.return_value.start.call_count == 2
+
+
+# ============================================================================
+# Tests for _refresh_active_admin_lookups
+# ============================================================================
+class TestRefreshActiveAdminLookups:
+    """Test suite for _refresh_active_admin_lookups helper function."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.get_docker_config")
+    @patch("docker_challenges._admin_lookup")
+    def test_only_recently_read_lookups_are_refreshed(self, mock_lookup, mock_get_config):
+        """Lookups nobody read within the idle window are not polled."""
+        reads = {"secret_list": 1000.0, "docker_info": 0.0}
+        with (
+            patch.dict("docker_challenges._admin_lookup_reads", reads, clear=True),
+            patch("docker_challenges.time.monotonic", return_value=1010.0),
+        ):
+            _refresh_active_admin_lookups(MagicMock())
+
+        mock_lookup.assert_called_once_with(mock_get_config.return_value, "secret_list", force=True)
+
+    @pytest.mark.light
+    @patch("docker_challenges.get_docker_config")
+    def test_idle_process_does_not_touch_docker(self, mock_get_config):
+        """With no recent reads, no app context is pushed and Docker is not contacted."""
+        app = MagicMock()
+        with patch.dict("docker_challenges._admin_lookup_reads", {}, clear=True):
+            _refresh_active_admin_lookups(app)
+
+        app.app_context.assert_not_called()
+        mock_get_config.assert_not_called()
+
+    @pytest.mark.light
+    @patch("docker_challenges.get_docker_config")
+    @patch("docker_challenges._admin_lookup")
+    def test_failing_lookup_does_not_skip_the_rest(self, mock_lookup, _mock_get_config):
+        """One lookup raising is logged and the remaining lookups still refresh."""
+        mock_lookup.side_effect = [RuntimeError("docker down"), ["nginx"]]
+        reads = {"docker_info": 1000.0, "repositories": 1000.0}
+        with (
+            patch.dict("docker_challenges._admin_lookup_reads", reads, clear=True),
+            patch("docker_challenges.time.monotonic", return_value=1000.0),
+            patch("docker_challenges.logging.exception") as mock_log,
+        ):
+            _refresh_active_admin_lookups(MagicMock())
+
+        assert mock_lookup.call_count == 2
+        mock_log.assert_called_once()
+
+
+# ============================================================================
+# Tests for _refresh_admin_lookups
+# ============================================================================
+class _StopLoop(BaseException):
+    """Raised from the patched sleep to leave the refresher's endless loop."""
+
+
+class TestRefreshAdminLookups:
+    """Test suite for the _refresh_admin_lookups background loop."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.get_docker_config")
+    @patch("docker_challenges.cached_lookup")
+    def test_refreshes_until_lookup_goes_idle(self, mock_cached_lookup, _mock_get_config):
+        """A lookup read by a request is refreshed each interval until it has been idle too long."""
+        mock_cached_lookup.side_effect = lambda docker, name, fetch, force=False: fetch()
+        fetch = MagicMock(return_value={"Swarm": {}})
+        read_at = 1000.0
+        with (
+            patch.dict("docker_challenges._ADMIN_LOOKUPS", {"docker_info": fetch}, clear=True),
+            patch.dict("docker_challenges._admin_lookup_reads", {}, clear=True),
+            patch(
+                "docker_challenges.time.monotonic",
+                side_effect=[
+                    read_at,
+                    read_at + DOCKER_LOOKUP_REFRESH_INTERVAL_SECONDS,
+                    read_at + ADMIN_LOOKUP_IDLE_SECONDS + 1,
+                ],
+            ),
+            patch("docker_challenges.time.sleep", side_effect=[None, _StopLoop()]),
+        ):
+            _admin_lookup(MagicMock(), "docker_info")
+            fetch.reset_mock()
+            with pytest.raises(_StopLoop):
+                _refresh_admin_lookups(MagicMock())
+
+        fetch.assert_called_once()
+
+    @pytest.mark.light
+    @patch("docker_challenges._refresh_active_admin_lookups")
+    def test_failed_pass_does_not_stop_the_loop(self, mock_refresh):
+        """An unexpected error in one pass is logged and the next interval still runs."""
+        mock_refresh.side_effect = [RuntimeError("boom"), None]
+        with (
+            patch("docker_challenges.time.sleep", side_effect=[None, _StopLoop()]),
+            patch("docker_challenges.logging.exception") as mock_log,
+            pytest.raises(_StopLoop),
+        ):
+            _refresh_admin_lookups(MagicMock())
+
+        assert mock_refresh.call_count == 2
+        mock_log.assert_called_once()
+
+
+# ============================================================================
+# Tests for _cacheable_response
+# ============================================================================
+class TestCacheableResponse:
+    """Test suite for _cacheable_response helper function."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.request")
+    @patch("docker_challenges.make_response")
+    def test_page_must_be_revalidated(self, mock_make_response, mock_request):
+        """Admin pages are private, no-cache and carry the given ETag."""
+        response = mock_make_response.return_value
+        response.cache_control = SimpleNamespace()
+
+        result = _cacheable_response("<html>", "etag-1")
+
+        assert response.cache_control.private is True
+        assert response.cache_control.no_cache is True
+        assert not hasattr(response.cache_control, "max_age")
+        response.set_etag.assert_called_once_with("etag-1")
+        response.make_conditional.assert_called_once_with(mock_request)
+        assert result is response.make_conditional.return_value
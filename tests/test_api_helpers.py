@@ -4,21 +4,27 @@ These tests validate:
 - _is_truthy: Boolean/string truthiness checking
 - _validate_secret_request: Secret creation request validation
 - _check_secret_uniqueness: Secret name conflict detection
+- _tracker_targets: Joined (instance_id, type) tracker query
+- get_docker_config: Per-request DockerConfig memoization
 
 Note: CTFd stubs are injected by conftest.py at module scope before test collection.
 """
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from docker_challenges.api.api import (
     _check_secret_uniqueness,
     _is_truthy,
+    _tracker_targets,
     _validate_secret_request,
+    get_docker_config,
 )
+from docker_challenges.models.models import DockerConfig
 
 
 # ============================================================================
@@ -273,3 +279,44 @@ class TestCheckSecretUniqueness:
         # Exact case should match
         error = _check_secret_uniqueness(mock_docker_config, "MySecret")
         assert error is not None
+
+
+# ============================================================================
+# Tests for _tracker_targets
+# ============================================================================
+class TestTrackerTargets:
+    """Test suite for _tracker_targets helper function."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.api.api.Challenges")
+    @patch("docker_challenges.api.api.db")
+    def test_criteria_apply_to_tracker_before_join(self, mock_db, mock_challenges):
+        """Owner criteria are applied before joining Challenges, restricted to Docker types."""
+        query = mock_db.session.query.return_value.select_from.return_value
+
+        result = _tracker_targets(team_id=3)
+
+        query.filter_by.assert_called_once_with(team_id=3)
+        query.filter_by.return_value.join.assert_called_once()
+        mock_challenges.type.in_.assert_called_once_with(("docker", "docker_service"))
+        assert result is query.filter_by.return_value.join.return_value.filter.return_value
+
+
+# ============================================================================
+# Tests for get_docker_config
+# ============================================================================
+class TestGetDockerConfig:
+    """Test suite for get_docker_config helper function."""
+
+    @pytest.mark.light
+    @patch("docker_challenges.api.api.db")
+    def test_config_is_loaded_once_per_request(self, mock_db):
+        """Repeated calls within one request context reuse the first identity-map lookup."""
+        config = MagicMock()
+        mock_db.session.get.return_value = config
+
+        with patch("docker_challenges.api.api.g", Namespace()):
+            assert get_docker_config() is config
+            assert get_docker_config() is config
+
+        mock_db.session.get.assert_called_once_with(DockerConfig, 1)
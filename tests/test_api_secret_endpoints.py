@@ -25,11 +25,12 @@ class TestSecretAPIGet:
     @pytest.mark.medium
     @patch("docker_challenges.api.api.is_swarm_mode")
     @patch("docker_challenges.api.api.get_secrets")
-    @patch("docker_challenges.api.api.DockerConfig")
-    def test_get_returns_secret_list(self, mock_config_cls, mock_get_secrets, mock_is_swarm):
+    @patch("docker_challenges.api.api.get_docker_config")
+    def test_get_returns_secret_list(
+        self, mock_get_config, mock_get_secrets, mock_is_swarm, mock_docker_config
+    ):
         """GET returns success with list of secrets when in swarm mode."""
-        mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker_config
         mock_is_swarm.return_value = True
         mock_get_secrets.return_value = [
             {"ID": "sec1", "Name": "my_secret"},
@@ -51,13 +52,12 @@ class TestSecretAPIGet:
     @pytest.mark.medium
     @patch("docker_challenges.api.api.is_swarm_mode")
     @patch("docker_challenges.api.api.get_secrets")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_get_returns_empty_list_when_swarm_active_no_secrets(
-        self, mock_config_cls, mock_get_secrets, mock_is_swarm
+        self, mock_get_config, mock_get_secrets, mock_is_swarm, mock_docker_config
     ):
         """GET returns success with empty data when in swarm mode but no secrets exist."""
-        mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker_config
         mock_is_swarm.return_value = True
         mock_get_secrets.return_value = []
 
@@ -69,13 +69,12 @@ class TestSecretAPIGet:
     @pytest.mark.medium
     @patch("docker_challenges.api.api.is_swarm_mode")
     @patch("docker_challenges.api.api.get_secrets")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_get_returns_swarm_mode_false_when_not_swarm(
-        self, mock_config_cls, mock_get_secrets, mock_is_swarm
+        self, mock_get_config, mock_get_secrets, mock_is_swarm, mock_docker_config
     ):
         """GET returns swarm_mode=false and skips get_secrets when not in swarm mode."""
-        mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker_config
         mock_is_swarm.return_value = False
 
         api = SecretAPI()
@@ -84,6 +83,26 @@ class TestSecretAPIGet:
         assert result == {"success": True, "data": [], "swarm_mode": False}
         mock_get_secrets.assert_not_called()
 
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api.is_swarm_mode")
+    @patch("docker_challenges.api.api.get_secrets")
+    @patch("docker_challenges.api.api.get_docker_config")
+    def test_repeat_get_reuses_cached_docker_lookups(
+        self, mock_get_config, mock_get_secrets, mock_is_swarm, mock_docker_config
+    ):
+        """Repeated form loads within the TTL query Docker only once."""
+        mock_get_config.return_value = mock_docker_config
+        mock_is_swarm.return_value = True
+        mock_get_secrets.return_value = [{"ID": "sec1", "Name": "my_secret"}]
+
+        api = SecretAPI()
+        first = api.get()
+        second = api.get()
+
+        assert first == second
+        mock_is_swarm.assert_called_once()
+        mock_get_secrets.assert_called_once()
+
 
 # ============================================================================
 # SecretAPI POST tests
@@ -98,9 +117,9 @@ class TestSecretAPIPost:
     @patch("docker_challenges.api.api.create_secret")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.request")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_post_validates_request_body(
-        self, mock_config_cls, mock_request, mock_get_secrets, mock_create, mock_user
+        self, mock_get_config, mock_request, mock_get_secrets, mock_create, mock_user
     ):
         """POST with missing name returns 400."""
         mock_request.get_json.return_value = {"data": "secret_value"}
@@ -146,9 +165,9 @@ class TestSecretAPIPost:
     @patch("docker_challenges.api.api.create_secret")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.request")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_post_requires_https_and_tls(
-        self, mock_config_cls, mock_request, mock_get_secrets, mock_create, mock_user
+        self, mock_get_config, mock_request, mock_get_secrets, mock_create, mock_user
     ):
         """POST without TLS+HTTPS returns 400."""
         mock_request.get_json.return_value = {"name": "my_secret", "data": "value"}
@@ -157,7 +176,7 @@ class TestSecretAPIPost:
 
         mock_docker = MagicMock()
         mock_docker.tls_enabled = False
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
 
         api = SecretAPI()
         result, status = api.post()
@@ -171,9 +190,9 @@ class TestSecretAPIPost:
     @patch("docker_challenges.api.api.create_secret")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.request")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_post_creates_secret_successfully(
-        self, mock_config_cls, mock_request, mock_get_secrets, mock_create, mock_user
+        self, mock_get_config, mock_request, mock_get_secrets, mock_create, mock_user
     ):
         """POST with valid data and secure transport returns 201."""
         mock_request.get_json.return_value = {"name": "new_secret", "data": "s3cret"}
@@ -182,7 +201,7 @@ class TestSecretAPIPost:
 
         mock_docker = MagicMock()
         mock_docker.tls_enabled = True
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
 
         mock_get_secrets.return_value = []  # No existing secrets
         mock_create.return_value = ("sec_new_id", True)
@@ -201,9 +220,9 @@ class TestSecretAPIPost:
     @patch("docker_challenges.api.api.create_secret")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.request")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_post_rejects_duplicate_name(
-        self, mock_config_cls, mock_request, mock_get_secrets, mock_create, mock_user
+        self, mock_get_config, mock_request, mock_get_secrets, mock_create, mock_user
     ):
         """POST with existing secret name returns 409."""
         mock_request.get_json.return_value = {"name": "existing", "data": "value"}
@@ -212,7 +231,7 @@ class TestSecretAPIPost:
 
         mock_docker = MagicMock()
         mock_docker.tls_enabled = True
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
 
         mock_get_secrets.return_value = [{"ID": "sec1", "Name": "existing"}]
 
@@ -236,9 +255,9 @@ class TestSecretAPIDelete:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.delete_secret")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_delete_validates_secret_id_format(
-        self, mock_config_cls, mock_delete, mock_get_secrets, mock_user
+        self, mock_get_config, mock_delete, mock_get_secrets, mock_user
     ):
         """DELETE with invalid secret_id format returns 400."""
         api = SecretAPI()
@@ -252,11 +271,11 @@ class TestSecretAPIDelete:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.delete_secret")
-    @patch("docker_challenges.api.api.DockerConfig")
-    def test_delete_succeeds(self, mock_config_cls, mock_delete, mock_get_secrets, mock_user):
+    @patch("docker_challenges.api.api.get_docker_config")
+    def test_delete_succeeds(self, mock_get_config, mock_delete, mock_get_secrets, mock_user):
         """DELETE with valid ID returns 200 on success."""
         mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_delete.return_value = True
         mock_user.return_value = MagicMock(name="admin")
 
@@ -271,11 +290,11 @@ class TestSecretAPIDelete:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.delete_secret")
-    @patch("docker_challenges.api.api.DockerConfig")
-    def test_delete_not_found(self, mock_config_cls, mock_delete, mock_get_secrets, mock_user):
+    @patch("docker_challenges.api.api.get_docker_config")
+    def test_delete_not_found(self, mock_get_config, mock_delete, mock_get_secrets, mock_user):
         """DELETE returns 404 when secret does not exist."""
         mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_delete.return_value = False
         mock_get_secrets.return_value = []  # Secret not found in list either
 
@@ -290,9 +309,9 @@ class TestSecretAPIDelete:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.delete_secret")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_delete_rejects_path_traversal(
-        self, mock_config_cls, mock_delete, mock_get_secrets, mock_user
+        self, mock_get_config, mock_delete, mock_get_secrets, mock_user
     ):
         """DELETE rejects path traversal attempts in secret_id."""
         api = SecretAPI()
@@ -306,9 +325,9 @@ class TestSecretAPIDelete:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.delete_secret")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_delete_rejects_special_chars(
-        self, mock_config_cls, mock_delete, mock_get_secrets, mock_user
+        self, mock_get_config, mock_delete, mock_get_secrets, mock_user
     ):
         """DELETE rejects special characters in secret_id."""
         api = SecretAPI()
@@ -330,13 +349,13 @@ class TestSecretBulkDeleteAPI:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.delete_secret")
     @patch("docker_challenges.api.api.get_secrets")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_bulk_delete_all_succeed(
-        self, mock_config_cls, mock_get_secrets, mock_delete, mock_user
+        self, mock_get_config, mock_get_secrets, mock_delete, mock_user
     ):
         """Bulk delete returns success when all secrets are deleted."""
         mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_get_secrets.return_value = [
             {"ID": "s1", "Name": "secret_one"},
             {"ID": "s2", "Name": "secret_two"},
@@ -356,11 +375,11 @@ class TestSecretBulkDeleteAPI:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.delete_secret")
     @patch("docker_challenges.api.api.get_secrets")
-    @patch("docker_challenges.api.api.DockerConfig")
-    def test_bulk_delete_all_fail(self, mock_config_cls, mock_get_secrets, mock_delete, mock_user):
+    @patch("docker_challenges.api.api.get_docker_config")
+    def test_bulk_delete_all_fail(self, mock_get_config, mock_get_secrets, mock_delete, mock_user):
         """Bulk delete returns success:false when all deletions fail."""
         mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_get_secrets.return_value = [
             {"ID": "s1", "Name": "in_use_1"},
             {"ID": "s2", "Name": "in_use_2"},
@@ -381,13 +400,13 @@ class TestSecretBulkDeleteAPI:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.delete_secret")
     @patch("docker_challenges.api.api.get_secrets")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_bulk_delete_partial_failure(
-        self, mock_config_cls, mock_get_secrets, mock_delete, mock_user
+        self, mock_get_config, mock_get_secrets, mock_delete, mock_user
     ):
         """Bulk delete with partial failure returns success:false with counts."""
         mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_get_secrets.return_value = [
             {"ID": "s1", "Name": "deletable"},
             {"ID": "s2", "Name": "in_use"},
@@ -410,13 +429,13 @@ class TestSecretBulkDeleteAPI:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.delete_secret")
     @patch("docker_challenges.api.api.get_secrets")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_bulk_delete_empty_list(
-        self, mock_config_cls, mock_get_secrets, mock_delete, mock_user
+        self, mock_get_config, mock_get_secrets, mock_delete, mock_user
     ):
         """Bulk delete with no secrets returns success with zero counts."""
         mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_get_secrets.return_value = []
 
         api = SecretBulkDeleteAPI()
@@ -443,9 +462,9 @@ class TestSecretAPIAuditLogging:
     @patch("docker_challenges.api.api.create_secret")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.request")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_post_logs_admin_username_and_secret_name(
-        self, mock_config_cls, mock_request, mock_get_secrets, mock_create, mock_user, mock_logging
+        self, mock_get_config, mock_request, mock_get_secrets, mock_create, mock_user, mock_logging
     ):
         """POST logs admin username and secret name but NOT the secret value."""
         mock_request.get_json.return_value = {"name": "db_password", "data": "super_secret_val"}
@@ -454,7 +473,7 @@ class TestSecretAPIAuditLogging:
 
         mock_docker = MagicMock()
         mock_docker.tls_enabled = True
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
 
         mock_get_secrets.return_value = []
         mock_create.return_value = ("sec_id_123", True)
@@ -477,13 +496,13 @@ class TestSecretAPIAuditLogging:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.delete_secret")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_delete_logs_admin_username_and_secret_id(
-        self, mock_config_cls, mock_delete, mock_get_secrets, mock_user, mock_logging
+        self, mock_get_config, mock_delete, mock_get_secrets, mock_user, mock_logging
     ):
         """DELETE logs admin username and secret ID."""
         mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_delete.return_value = True
         mock_user.return_value = MagicMock(name="admin_user")
 
@@ -501,13 +520,13 @@ class TestSecretAPIAuditLogging:
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api.delete_secret")
     @patch("docker_challenges.api.api.get_secrets")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_bulk_delete_logs_counts(
-        self, mock_config_cls, mock_get_secrets, mock_delete, mock_user, mock_logging
+        self, mock_get_config, mock_get_secrets, mock_delete, mock_user, mock_logging
     ):
         """Bulk delete logs deleted/failed counts."""
         mock_docker = MagicMock()
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_get_secrets.return_value = [
             {"ID": "s1", "Name": "secret_one"},
             {"ID": "s2", "Name": "secret_two"},
@@ -536,9 +555,9 @@ class TestSecretAPITOCTOU:
     @patch("docker_challenges.api.api.create_secret")
     @patch("docker_challenges.api.api.get_secrets")
     @patch("docker_challenges.api.api.request")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     def test_post_handles_docker_409_when_uniqueness_check_passes(
-        self, mock_config_cls, mock_request, mock_get_secrets, mock_create, mock_user
+        self, mock_get_config, mock_request, mock_get_secrets, mock_create, mock_user
     ):
         """POST returns 500 when uniqueness check passes but Docker returns conflict.
 
@@ -551,7 +570,7 @@ class TestSecretAPITOCTOU:
 
         mock_docker = MagicMock()
         mock_docker.tls_enabled = True
-        mock_config_cls.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
 
         mock_get_secrets.return_value = []  # Uniqueness check passes
         mock_create.return_value = (None, False)  # But Docker rejects (race condition)
@@ -1,17 +1,29 @@
 """Tests for _handle_container_creation() container workflow orchestration.
 
-Tests exercise the complete container creation workflow including stale
-cleanup, existing container checks, revert logic, and Docker API failure
-handling. All helper functions are patched at the module level.
+Tests exercise the complete container creation workflow including existing
+container checks, revert logic, and Docker API failure handling, plus the
+batched stale cleanup and kill helpers. All helper functions are patched at the module level.
 """
 
 from __future__ import annotations
 
-import json
+from collections import namedtuple
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from docker_challenges.api.api import (
+    _RESOURCE_DELETERS,
+    DockerChallengeTracker,
+    DockerStatus,
+    _delete_docker_resource,
+    _delete_tracker_entries,
+    _kill_all_containers,
+    _kill_single_container,
+    _track_container,
+    cleanup_stale_containers,
+)
+
 # ============================================================================
 # _handle_container_creation tests
 # ============================================================================
@@ -25,10 +37,8 @@ class TestHandleContainerCreation:
     @patch("docker_challenges.api.api.get_unavailable_ports")
     @patch("docker_challenges.api.api._should_revert_container")
     @patch("docker_challenges.api.api._get_existing_container")
-    @patch("docker_challenges.api.api._cleanup_stale_containers")
     def test_first_time_creation_returns_instance_and_ports(
         self,
-        mock_cleanup,
         mock_get_existing,
         mock_should_revert,
         mock_get_ports,
@@ -44,7 +54,7 @@ class TestHandleContainerCreation:
         mock_session = MagicMock()
 
         mock_get_existing.return_value = None
-        mock_get_ports.return_value = [30000, 30001]
+        mock_get_ports.return_value = {30000, 30001}
         mock_create.return_value = ("container_abc123", ["30002/tcp->80"], '{"HostConfig": {}}')
 
         result = _handle_container_creation(mock_docker, mock_challenge, mock_session, False)
@@ -53,7 +63,6 @@ class TestHandleContainerCreation:
         instance_id, ports = result
         assert instance_id == "container_abc123"
         assert ports == ["30002/tcp->80"]
-        mock_cleanup.assert_called_once()
         mock_get_existing.assert_called_once()
 
     @pytest.mark.medium
@@ -61,10 +70,8 @@ class TestHandleContainerCreation:
     @patch("docker_challenges.api.api.get_unavailable_ports")
     @patch("docker_challenges.api.api._should_revert_container")
     @patch("docker_challenges.api.api._get_existing_container")
-    @patch("docker_challenges.api.api._cleanup_stale_containers")
     def test_existing_container_under_five_minutes_returns_none(
         self,
-        mock_cleanup,
         mock_get_existing,
         mock_should_revert,
         mock_get_ports,
@@ -92,10 +99,8 @@ class TestHandleContainerCreation:
     @patch("docker_challenges.api.api.delete_docker")
     @patch("docker_challenges.api.api._should_revert_container")
     @patch("docker_challenges.api.api._get_existing_container")
-    @patch("docker_challenges.api.api._cleanup_stale_containers")
     def test_existing_container_over_five_minutes_triggers_revert(
         self,
-        mock_cleanup,
         mock_get_existing,
         mock_should_revert,
         mock_delete_docker,
@@ -114,7 +119,7 @@ class TestHandleContainerCreation:
         existing.instance_id = "old_container_id"
         mock_get_existing.return_value = existing
         mock_should_revert.return_value = True  # Over 5 minutes
-        mock_get_ports.return_value = []
+        mock_get_ports.return_value = set()
         mock_create.return_value = ("new_container_id", ["30005/tcp->80"], "{}")
 
         result = _handle_container_creation(mock_docker, mock_challenge, mock_session, False)
@@ -131,39 +136,8 @@ class TestHandleContainerCreation:
     @patch("docker_challenges.api.api.get_unavailable_ports")
     @patch("docker_challenges.api.api._should_revert_container")
     @patch("docker_challenges.api.api._get_existing_container")
-    @patch("docker_challenges.api.api._cleanup_stale_containers")
-    def test_stale_cleanup_runs_before_creation(
-        self,
-        mock_cleanup,
-        mock_get_existing,
-        mock_should_revert,
-        mock_get_ports,
-        mock_create,
-    ):
-        """Stale container cleanup runs before any creation logic."""
-        from docker_challenges.api.api import _handle_container_creation
-
-        mock_docker = MagicMock()
-        mock_challenge = MagicMock()
-        mock_session = MagicMock()
-
-        mock_get_existing.return_value = None
-        mock_get_ports.return_value = []
-        mock_create.return_value = ("id", ["port"], "{}")
-
-        _handle_container_creation(mock_docker, mock_challenge, mock_session, True)
-
-        mock_cleanup.assert_called_once_with(mock_docker, mock_session, True)
-
-    @pytest.mark.medium
-    @patch("docker_challenges.api.api._create_docker_instance")
-    @patch("docker_challenges.api.api.get_unavailable_ports")
-    @patch("docker_challenges.api.api._should_revert_container")
-    @patch("docker_challenges.api.api._get_existing_container")
-    @patch("docker_challenges.api.api._cleanup_stale_containers")
     def test_docker_api_failure_returns_false(
         self,
-        mock_cleanup,
         mock_get_existing,
         mock_should_revert,
         mock_get_ports,
@@ -177,7 +151,7 @@ class TestHandleContainerCreation:
         mock_session = MagicMock()
 
         mock_get_existing.return_value = None
-        mock_get_ports.return_value = []
+        mock_get_ports.return_value = set()
         mock_create.return_value = (None, None, None)  # Creation failed
 
         result = _handle_container_creation(mock_docker, mock_challenge, mock_session, False)
@@ -190,10 +164,8 @@ class TestHandleContainerCreation:
     @patch("docker_challenges.api.api.delete_docker")
     @patch("docker_challenges.api.api._should_revert_container")
     @patch("docker_challenges.api.api._get_existing_container")
-    @patch("docker_challenges.api.api._cleanup_stale_containers")
     def test_revert_continues_on_deletion_failure(
         self,
-        mock_cleanup,
         mock_get_existing,
         mock_should_revert,
         mock_delete_docker,
@@ -213,7 +185,7 @@ class TestHandleContainerCreation:
         mock_get_existing.return_value = existing
         mock_should_revert.return_value = True
         mock_delete_docker.return_value = False  # Deletion fails
-        mock_get_ports.return_value = []
+        mock_get_ports.return_value = set()
         mock_create.return_value = ("new_container_id", ["30005/tcp->80"], "{}")
 
         result = _handle_container_creation(mock_docker, mock_challenge, mock_session, False)
@@ -233,10 +205,8 @@ class TestHandleContainerCreation:
     @patch("docker_challenges.api.api.delete_docker")
     @patch("docker_challenges.api.api._should_revert_container")
     @patch("docker_challenges.api.api._get_existing_container")
-    @patch("docker_challenges.api.api._cleanup_stale_containers")
     def test_stale_tracker_entry_deleted_when_revert_fails(
         self,
-        mock_cleanup,
         mock_get_existing,
         mock_should_revert,
         mock_delete_docker,
@@ -258,7 +228,7 @@ class TestHandleContainerCreation:
         mock_get_existing.return_value = existing
         mock_should_revert.return_value = True
         mock_delete_docker.return_value = False  # Revert fails
-        mock_get_ports.return_value = []
+        mock_get_ports.return_value = set()
         mock_create.return_value = ("new_id", ["port"], "{}")
 
         _handle_container_creation(mock_docker, mock_challenge, mock_session, False)
@@ -275,10 +245,8 @@ class TestHandleContainerCreation:
     @patch("docker_challenges.api.api.delete_docker")
     @patch("docker_challenges.api.api._should_revert_container")
     @patch("docker_challenges.api.api._get_existing_container")
-    @patch("docker_challenges.api.api._cleanup_stale_containers")
     def test_tracker_not_touched_when_revert_succeeds(
         self,
-        mock_cleanup,
         mock_get_existing,
         mock_should_revert,
         mock_delete_docker,
@@ -300,7 +268,7 @@ class TestHandleContainerCreation:
         mock_get_existing.return_value = existing
         mock_should_revert.return_value = True
         mock_delete_docker.return_value = True  # Revert succeeds
-        mock_get_ports.return_value = []
+        mock_get_ports.return_value = set()
         mock_create.return_value = ("new_id", ["port"], "{}")
 
         _handle_container_creation(mock_docker, mock_challenge, mock_session, False)
@@ -311,20 +279,20 @@ class TestHandleContainerCreation:
 
 
 class TestDeleteDocker:
-    """Tests for delete_docker return value behavior."""
+    """Tests for delete_docker and batched tracker deletion."""
 
     @pytest.mark.medium
     @patch("docker_challenges.api.api.db")
     @patch("docker_challenges.api.api.DockerChallengeTracker")
-    @patch("docker_challenges.api.api.delete_container")
-    def test_returns_true_on_success(self, mock_delete_container, mock_tracker, mock_db):
+    def test_returns_true_on_success(self, mock_tracker, mock_db):
         """delete_docker returns True and removes tracker on successful deletion."""
         from docker_challenges.api.api import delete_docker
 
         mock_docker = MagicMock()
-        mock_delete_container.return_value = True
+        mock_delete_container = MagicMock(return_value=True)
 
-        result = delete_docker(mock_docker, "docker", "container_123")
+        with patch.dict(_RESOURCE_DELETERS, {"docker": ("container", mock_delete_container)}):
+            result = delete_docker(mock_docker, "docker", "container_123")
 
         assert result is True
         mock_delete_container.assert_called_once_with(mock_docker, "container_123")
@@ -334,20 +302,165 @@ class TestDeleteDocker:
     @pytest.mark.medium
     @patch("docker_challenges.api.api.db")
     @patch("docker_challenges.api.api.DockerChallengeTracker")
-    @patch("docker_challenges.api.api.delete_container")
-    def test_returns_false_on_failure(self, mock_delete_container, mock_tracker, mock_db):
+    def test_returns_false_on_failure(self, mock_tracker, mock_db):
         """delete_docker returns False and does NOT remove tracker on failed deletion."""
         from docker_challenges.api.api import delete_docker
 
         mock_docker = MagicMock()
-        mock_delete_container.return_value = False
+        mock_delete_container = MagicMock(return_value=False)
 
-        result = delete_docker(mock_docker, "docker", "container_123")
+        with patch.dict(_RESOURCE_DELETERS, {"docker": ("container", mock_delete_container)}):
+            result = delete_docker(mock_docker, "docker", "container_123")
 
         assert result is False
         mock_tracker.query.filter_by.assert_not_called()
         mock_db.session.commit.assert_not_called()
 
+    @pytest.mark.medium
+    def test_resource_delete_dispatches_on_challenge_type(self):
+        """Service challenges use the service deleter; unknown types fall back to containers."""
+        mock_docker = MagicMock()
+        mock_delete_container = MagicMock(return_value=True)
+        mock_delete_service = MagicMock(return_value=True)
+        deleters = {
+            "docker": ("container", mock_delete_container),
+            "docker_service": ("service", mock_delete_service),
+        }
+
+        with patch.dict(_RESOURCE_DELETERS, deleters):
+            assert _delete_docker_resource(mock_docker, "docker_service", "svc_1") is True
+            assert _delete_docker_resource(mock_docker, "unknown", "ctr_1") is True
+
+        mock_delete_service.assert_called_once_with(mock_docker, "svc_1")
+        mock_delete_container.assert_called_once_with(mock_docker, "ctr_1")
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api.TRACKER_DELETE_CHUNK_SIZE", 2)
+    @patch("docker_challenges.api.api.db")
+    @patch("docker_challenges.api.api.DockerChallengeTracker")
+    def test_bulk_tracker_delete_is_chunked_with_one_commit(self, mock_tracker, mock_db):
+        """Batched untracking issues one DELETE per chunk and commits once."""
+        _delete_tracker_entries(["a", "b", "c", "d", "e"])
+
+        chunks = [c.args[0] for c in mock_tracker.instance_id.in_.call_args_list]
+        assert chunks == [["a", "b"], ["c", "d"], ["e"]]
+        mock_db.session.commit.assert_called_once()
+
+
+class TestCleanupStaleContainers:
+    """Tests for batched stale container cleanup."""
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api.unix_time", return_value=10_000)
+    @patch("docker_challenges.api.api._delete_tracker_entries")
+    @patch("docker_challenges.api.api._delete_docker_resource")
+    @patch("docker_challenges.api.api._tracker_targets")
+    def test_single_query_and_batched_tracker_delete(
+        self, mock_targets, mock_delete_resource, mock_delete_entries, _mock_time
+    ):
+        """Stale instances and their types come from one query; deletes are batched."""
+        mock_targets.return_value.filter.return_value.all.return_value = [
+            ("c1", "docker"),
+            ("s1", "docker_service"),
+            ("c2", "docker"),
+        ]
+        mock_delete_resource.side_effect = lambda _docker, _type, iid: iid != "c2"
+        mock_docker = MagicMock()
+
+        cleanup_stale_containers(mock_docker, MagicMock(id=5), False)
+
+        mock_targets.assert_called_once_with(user_id=5)
+        assert mock_delete_resource.call_count == 3
+        mock_delete_resource.assert_any_call(mock_docker, "docker_service", "s1")
+        mock_delete_entries.assert_called_once_with(["c1", "s1"])
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api._delete_tracker_entries")
+    @patch("docker_challenges.api.api._delete_docker_resource")
+    @patch("docker_challenges.api.api._tracker_targets")
+    def test_no_stale_containers_deletes_nothing(
+        self, mock_targets, mock_delete_resource, mock_delete_entries
+    ):
+        """Nothing is deleted when no instance is stale."""
+        mock_targets.return_value.filter.return_value.all.return_value = []
+
+        cleanup_stale_containers(MagicMock(), MagicMock(id=5), True)
+
+        mock_targets.assert_called_once_with(team_id=5)
+        mock_delete_resource.assert_not_called()
+        mock_delete_entries.assert_called_once_with([])
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api._delete_tracker_entries")
+    @patch("docker_challenges.api.api._tracker_targets")
+    def test_without_session_sweeps_every_owner(self, mock_targets, _mock_delete):
+        """The background sweep (no session) does not filter by team or user."""
+        mock_targets.return_value.filter.return_value.all.return_value = []
+
+        cleanup_stale_containers(MagicMock())
+
+        mock_targets.assert_called_once_with()
+
+
+class TestKillContainers:
+    """Tests for the admin kill (nuke) helpers."""
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api._delete_tracker_entries")
+    @patch("docker_challenges.api.api._delete_docker_resource")
+    @patch("docker_challenges.api.api._tracker_targets")
+    def test_kill_all_untracks_deleted_instances_in_one_batch(
+        self, mock_targets, mock_delete_resource, mock_delete_entries
+    ):
+        """Kill-all deletes every joined instance and removes their trackers together."""
+        mock_targets.return_value.yield_per.return_value = iter(
+            [("c1", "docker"), ("s1", "docker_service")]
+        )
+        mock_delete_resource.side_effect = lambda _docker, _type, iid: iid == "s1"
+
+        _kill_all_containers(MagicMock())
+
+        mock_targets.assert_called_once_with()
+        assert mock_delete_resource.call_count == 2
+        mock_delete_entries.assert_called_once_with(["s1"])
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api._delete_tracker_entries")
+    @patch("docker_challenges.api.api._delete_docker_resource")
+    @patch("docker_challenges.api.api._tracker_targets")
+    def test_kill_all_deletes_each_batch_before_reading_the_next(
+        self, mock_targets, mock_delete_resource, mock_delete_entries
+    ):
+        """Rows are consumed one 200-row batch at a time, not all up front."""
+        events = []
+
+        def rows():
+            for i in range(201):
+                events.append(("read", i))
+                yield f"c{i}", "docker"
+
+        def delete(_docker, _type, instance_id):
+            events.append(("delete", instance_id))
+            return True
+
+        mock_targets.return_value.yield_per.return_value = rows()
+        mock_delete_resource.side_effect = delete
+
+        _kill_all_containers(MagicMock())
+
+        # The 201st row is only read after the whole first batch has been deleted
+        assert events.index(("read", 200)) > events.index(("delete", "c199"))
+        assert len(mock_delete_entries.call_args.args[0]) == 201
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api.delete_docker")
+    def test_kill_single_missing_tracker_returns_404(self, mock_delete_docker):
+        """An untracked container id is reported as not found."""
+        result = _kill_single_container(MagicMock(), None)
+
+        assert result == ({"success": False, "error": "Container not found"}, 404)
+        mock_delete_docker.assert_not_called()
+
 
 # ============================================================================
 # _create_docker_instance tests (container vs service branches)
@@ -374,7 +487,7 @@ class TestCreateDockerInstance:
         port_bindings = {"30100/tcp": [{"HostPort": "30100"}]}
         mock_create_container.return_value = (
             "cont_id_123",
-            json.dumps({"HostConfig": {"PortBindings": port_bindings}}),
+            {"HostConfig": {"PortBindings": port_bindings}},
         )
 
         instance_id, ports, data = _create_docker_instance(
@@ -409,7 +522,7 @@ class TestCreateDockerInstance:
                 ]
             }
         }
-        mock_create_service.return_value = ("svc_id_456", json.dumps(endpoint_spec))
+        mock_create_service.return_value = ("svc_id_456", endpoint_spec)
 
         instance_id, ports, data = _create_docker_instance(
             mock_docker, mock_challenge, mock_session, [30000]
@@ -488,7 +601,7 @@ class TestContainerAPIPostTrackerRollback:
     @patch("docker_challenges.api.api._track_container")
     @patch("docker_challenges.api.api._handle_container_creation")
     @patch("docker_challenges.api.api._get_challenge_by_id")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     @patch("docker_challenges.api.api.is_teams_mode")
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api._parse_container_request")
@@ -497,7 +610,7 @@ class TestContainerAPIPostTrackerRollback:
         mock_parse,
         mock_get_user,
         mock_is_teams,
-        mock_docker_config,
+        mock_get_config,
         mock_get_challenge,
         mock_handle,
         mock_track,
@@ -510,7 +623,7 @@ class TestContainerAPIPostTrackerRollback:
         mock_is_teams.return_value = False
         mock_get_user.return_value = MagicMock()
         mock_docker = MagicMock()
-        mock_docker_config.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_challenge = MagicMock()
         mock_challenge.docker_type = "service"
         mock_get_challenge.return_value = mock_challenge
@@ -530,7 +643,7 @@ class TestContainerAPIPostTrackerRollback:
     @patch("docker_challenges.api.api._track_container")
     @patch("docker_challenges.api.api._handle_container_creation")
     @patch("docker_challenges.api.api._get_challenge_by_id")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     @patch("docker_challenges.api.api.is_teams_mode")
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api._parse_container_request")
@@ -539,7 +652,7 @@ class TestContainerAPIPostTrackerRollback:
         mock_parse,
         mock_get_user,
         mock_is_teams,
-        mock_docker_config,
+        mock_get_config,
         mock_get_challenge,
         mock_handle,
         mock_track,
@@ -552,7 +665,7 @@ class TestContainerAPIPostTrackerRollback:
         mock_is_teams.return_value = False
         mock_get_user.return_value = MagicMock()
         mock_docker = MagicMock()
-        mock_docker_config.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_challenge = MagicMock()
         mock_challenge.docker_type = "container"
         mock_get_challenge.return_value = mock_challenge
@@ -571,7 +684,7 @@ class TestContainerAPIPostTrackerRollback:
     @patch("docker_challenges.api.api._track_container")
     @patch("docker_challenges.api.api._handle_container_creation")
     @patch("docker_challenges.api.api._get_challenge_by_id")
-    @patch("docker_challenges.api.api.DockerConfig")
+    @patch("docker_challenges.api.api.get_docker_config")
     @patch("docker_challenges.api.api.is_teams_mode")
     @patch("docker_challenges.api.api.get_current_user")
     @patch("docker_challenges.api.api._parse_container_request")
@@ -580,7 +693,7 @@ class TestContainerAPIPostTrackerRollback:
         mock_parse,
         mock_get_user,
         mock_is_teams,
-        mock_docker_config,
+        mock_get_config,
         mock_get_challenge,
         mock_handle,
         mock_track,
@@ -593,7 +706,7 @@ class TestContainerAPIPostTrackerRollback:
         mock_get_user.return_value = MagicMock()
         mock_docker = MagicMock()
         mock_docker.hostname = "docker.host:2376"
-        mock_docker_config.query.filter_by.return_value.first.return_value = mock_docker
+        mock_get_config.return_value = mock_docker
         mock_challenge = MagicMock()
         mock_challenge.docker_type = "service"
         mock_get_challenge.return_value = mock_challenge
@@ -606,7 +719,92 @@ class TestContainerAPIPostTrackerRollback:
         response, status_code = result
         assert status_code == 201
         assert response["success"] is True
+        assert response["data"]["host"] == "docker.host"
         mock_track.assert_called_once()
+        assert mock_track.call_args.args[0] == "docker.host"
+
+
+# ============================================================================
+# _track_container tracker insert
+# ============================================================================
+class TestTrackContainer:
+    """Tests for _track_container tracker inserts."""
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api.unix_time", return_value=1_000)
+    @patch("docker_challenges.api.api.db")
+    def test_inserts_single_mapping_and_commits(self, mock_db, _mock_time):
+        """The tracker row is bulk-inserted from a mapping with one shared timestamp."""
+        challenge = MagicMock(id=7, docker_image="nginx:latest")
+
+        _track_container("docker.local", challenge, MagicMock(id=3), True, "abc", ["31000/tcp->80"])
+
+        model, rows = mock_db.session.bulk_insert_mappings.call_args.args
+        assert model is DockerChallengeTracker
+        assert rows == [
+            {
+                "team_id": 3,
+                "challenge_id": 7,
+                "docker_image": "nginx:latest",
+                "timestamp": 1_000,
+                "revert_time": 1_300,
+                "instance_id": "abc",
+                "ports": "31000/tcp->80",
+                "host": "docker.local",
+            }
+        ]
+        mock_db.session.commit.assert_called_once()
+
+
+# ============================================================================
+# DockerStatus.get() serialization
+# ============================================================================
+
+
+class TestDockerStatusGet:
+    """Tests for the per-user container status endpoint."""
+
+    @pytest.mark.medium
+    @patch("docker_challenges.api.api.DockerChallengeTracker.query")
+    @patch("docker_challenges.api.api.get_docker_config")
+    @patch("docker_challenges.api.api.is_teams_mode", return_value=False)
+    @patch("docker_challenges.api.api.get_current_user")
+    def test_serializes_projected_rows(
+        self, mock_get_user, _mock_is_teams, mock_get_config, mock_query
+    ):
+        """Selected columns are returned with split ports and the Docker host."""
+        row_type = namedtuple(
+            "Row",
+            "id team_id user_id challenge_id docker_image timestamp revert_time instance_id ports",
+        )
+        mock_get_user.return_value = MagicMock(id=7)
+        mock_get_config.return_value = MagicMock(hostname="docker.local:2376")
+        tracker = mock_query.filter_by.return_value
+        tracker.with_entities.return_value.all.return_value = [
+            row_type(1, None, "7", 3, "nginx", 100, 400, "abc", "30001/tcp->80,30002/tcp->443")
+        ]
+
+        result = DockerStatus().get()
+
+        mock_query.filter_by.assert_called_once_with(user_id=7)
+        assert tracker.with_entities.call_args.args[0] is DockerChallengeTracker.id
+        assert result == {
+            "success": True,
+            "data": [
+                {
+                    "id": 1,
+                    "team_id": None,
+                    "user_id": "7",
+                    "challenge_id": 3,
+                    "docker_image": "nginx",
+                    "timestamp": 100,
+                    "revert_time": 400,
+                    "instance_id": "abc",
+                    "ports": ["30001/tcp->80", "30002/tcp->443"],
+                    "host": "docker.local",
+                }
+            ],
+        }
 
 
 # ============================================================================
@@ -14,6 +14,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 import responses
 
+from docker_challenges.functions.general import resolve_exposed_ports_from_image
+
 
 # ============================================================================
 # resolve_exposed_ports_from_image tests
@@ -41,6 +43,21 @@ class TestResolveExposedPortsFromImage:
         assert result is not None
         assert set(result.split(",")) == {"80/tcp", "443/tcp"}
 
+    @pytest.mark.medium
+    @responses.activate
+    def test_image_metadata_is_fetched_once_per_ttl(self, mock_docker_config):
+        """Repeated resolutions for the same image reuse the cached ExposedPorts."""
+        responses.add(
+            responses.GET,
+            "http://localhost:2375/images/nginx:latest/json?all=1",
+            json={"Config": {"ExposedPorts": {"80/tcp": {}}}},
+            status=200,
+        )
+
+        assert resolve_exposed_ports_from_image(mock_docker_config, "nginx:latest") == "80/tcp"
+        assert resolve_exposed_ports_from_image(mock_docker_config, "nginx:latest") == "80/tcp"
+        assert len(responses.calls) == 1
+
     @pytest.mark.medium
     @responses.activate
     def test_returns_none_when_image_has_no_exposed_ports(self, mock_docker_config):
@@ -7,11 +7,16 @@ All tests are marked with @pytest.mark.medium as they require HTTP mocking.
 
 from __future__ import annotations
 
+import socket
+from unittest.mock import patch
+
 import pytest
 import responses
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
+from docker_challenges.functions.containers import _container_name, find_existing
 from docker_challenges.functions.general import (
+    _docker_session,
     do_request,
     get_docker_info,
     get_repositories,
@@ -53,6 +58,27 @@ def test_do_request_makes_get_request(mock_docker_config):
     assert result is not None
     assert result.status_code == 200
     assert result.json() == [{"Id": "abc123"}]
+    assert responses.calls[0].request.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.medium
+def test_do_request_reuses_shared_session(mock_docker_config):
+    """do_request sends every call through the shared keep-alive session."""
+    with patch("docker_challenges.functions.general._docker_session.request") as mock_request:
+        do_request(mock_docker_config, "/info")
+        do_request(mock_docker_config, "/version")
+
+    assert mock_request.call_count == 2
+    assert mock_request.call_args.kwargs["url"] == "http://localhost:2375/version"
+
+
+@pytest.mark.medium
+def test_shared_session_enables_tcp_nodelay_and_keepalive():
+    """Pooled Docker connections disable Nagle and enable TCP keepalive."""
+    adapter = _docker_session.get_adapter("http://localhost:2375")
+    options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
 
 
 @pytest.mark.medium
@@ -237,6 +263,54 @@ def test_get_repositories_skips_none_and_none_tags(mock_docker_config):
     assert len(result) == 2
 
 
+@pytest.mark.medium
+@responses.activate
+def test_get_repositories_keeps_registry_port_in_name(mock_docker_config):
+    """get_repositories splits only the tag off images from registries with a port."""
+    responses.add(
+        responses.GET,
+        "http://localhost:2375/images/json?all=1",
+        json=[{"RepoTags": ["registry:5000/ctf/web:1.0"]}],
+        status=200,
+    )
+
+    result = get_repositories(mock_docker_config, repos="registry:5000/ctf/web")
+
+    assert result == ["registry:5000/ctf/web"]
+
+
+@pytest.mark.medium
+@responses.activate
+def test_get_repositories_keeps_untagged_registry_port_image(mock_docker_config):
+    """get_repositories does not mistake a registry port for a tag."""
+    responses.add(
+        responses.GET,
+        "http://localhost:2375/images/json?all=1",
+        json=[{"RepoTags": ["registry:5000/ctf/web"]}],
+        status=200,
+    )
+
+    result = get_repositories(mock_docker_config)
+
+    assert result == ["registry:5000/ctf/web"]
+
+
+@pytest.mark.medium
+@responses.activate
+def test_get_repositories_accepts_tag_without_colon(mock_docker_config):
+    """get_repositories returns an image reference without a tag unchanged."""
+    responses.add(
+        responses.GET,
+        "http://localhost:2375/images/json?all=1",
+        json=[{"RepoTags": ["nginx"]}, {"RepoTags": ["redis:7.0"]}],
+        status=200,
+    )
+
+    result = get_repositories(mock_docker_config)
+
+    assert sorted(result) == ["nginx", "redis"]
+
+
 @pytest.mark.medium
 def test_get_repositories_returns_empty_list_when_docker_unreachable(mock_docker_config):
     """get_repositories returns empty list when Docker API is unreachable."""
@@ -270,9 +344,7 @@ def test_get_docker_info_returns_formatted_version_string(mock_docker_config):
 
     result = get_docker_info(mock_docker_config)
 
-    assert "Docker versions:" in result
-    assert "Engine: 24.0.7" in result
-    assert "containerd: 1.6.25" in result
+    assert result == "Docker versions:\nEngine: 24.0.7\ncontainerd: 1.6.25\n"
 
 
 @pytest.mark.medium
@@ -401,7 +473,7 @@ def test_get_secrets_returns_empty_list_when_not_swarm_mode(mock_docker_config):
 @pytest.mark.medium
 @responses.activate
 def test_get_unavailable_ports_returns_combined_container_and_service_ports(mock_docker_config):
-    """get_unavailable_ports returns combined list of container and service ports."""
+    """get_unavailable_ports returns combined set of container and service ports."""
     # Mock container endpoint
     responses.add(
         responses.GET,
@@ -444,7 +516,7 @@ def test_get_unavailable_ports_returns_combined_container_and_service_ports(mock
 
     result = get_unavailable_ports(mock_docker_config)
 
-    assert sorted(result) == [5432, 8080, 8443, 9000, 9001]
+    assert result == {5432, 8080, 8443, 9000, 9001}
 
 
 @pytest.mark.medium
@@ -472,21 +544,23 @@ def test_get_unavailable_ports_returns_only_container_ports_when_not_swarm(mock_
         status=503,
     )
 
-    result = get_unavailable_ports(mock_docker_config)
+    with patch("docker_challenges.functions.general.logging.error") as mock_error:
+        result = get_unavailable_ports(mock_docker_config)
 
-    assert result == [8080]
+    assert result == {8080}
+    mock_error.assert_not_called()
 
 
 @pytest.mark.medium
 def test_get_unavailable_ports_returns_empty_list_when_container_endpoint_unreachable(
     mock_docker_config,
 ):
-    """get_unavailable_ports returns empty list when container endpoint is unreachable."""
+    """get_unavailable_ports returns empty set when container endpoint is unreachable."""
     mock_docker_config.hostname = ""  # Will cause do_request to return []
 
     result = get_unavailable_ports(mock_docker_config)
 
-    assert result == []
+    assert result == set()
 
 
 # ============================================================================
@@ -525,6 +599,35 @@ def test_create_container_returns_none_on_unreachable(mock_docker_config):
     """create_container returns (None, None) when Docker API is unreachable."""
     mock_docker_config.hostname = ""
     from docker_challenges.functions.containers import create_container
-    instance_id, data = create_container(mock_docker_config, "nginx:latest", "team1", [], "80/tcp")
+    instance_id, data = create_container(
+        mock_docker_config, "nginx:latest", "team1", set(), "80/tcp"
+    )
     assert instance_id is None
     assert data is None
+
+
+@pytest.mark.medium
+def test_container_name_sanitizes_image_and_hashes_team():
+    """Container names replace image separators and append a stable team hash."""
+    name = _container_name("registry.io/ctf/web:1.0", "team1")
+    assert name.startswith("registry_io_ctf_web_1_0_")
+    assert len(name.rsplit("_", 1)[1]) == 10
+    assert _container_name("registry.io/ctf/web:1.0", "team1") == name
+    assert _container_name("registry.io/ctf/web:1.0", "team2") != name
+
+
+@pytest.mark.medium
+@responses.activate
+def test_find_existing_matches_exact_name_only(mock_docker_config):
+    """Docker's substring name filter hits are narrowed to the exact container name."""
+    responses.add(
+        responses.GET,
+        "http://localhost:2375/containers/json",
+        json=[
+            {"Id": "other", "Names": ["/myweb_abc"]},
+            {"Id": "wanted", "Names": ["/web_abc"]},
+        ],
+        status=200,
+    )
+    assert find_existing(mock_docker_config, "web_abc") == "wanted"
+    assert find_existing(mock_docker_config, "eb_abc") is None
@@ -25,19 +25,19 @@ class TestExtractContainerPorts:
             }
         ]
         result = _extract_container_ports(containers)
-        assert result == [8080, 8443]
+        assert result == {8080, 8443}
 
     def test_skip_container_without_ports_key(self):
         """Container with no Ports key is skipped."""
         containers = [{"Id": "abc123", "Status": "running"}]
         result = _extract_container_ports(containers)
-        assert result == []
+        assert result == set()
 
     def test_skip_container_with_empty_ports_list(self):
         """Container with empty Ports list is skipped."""
         containers = [{"Id": "abc123", "Ports": []}]
         result = _extract_container_ports(containers)
-        assert result == []
+        assert result == set()
 
     def test_skip_port_with_public_port_zero(self):
         """Container with PublicPort=0 is skipped (truthy check)."""
@@ -50,7 +50,7 @@ class TestExtractContainerPorts:
             }
         ]
         result = _extract_container_ports(containers)
-        assert result == []
+        assert result == set()
 
     def test_mixed_containers_extracts_only_with_ports(self):
         """Mixed containers: some with ports, some without - extracts only from those with ports."""
@@ -67,12 +67,12 @@ class TestExtractContainerPorts:
             },
         ]
         result = _extract_container_ports(containers)
-        assert result == [8080, 8443]
+        assert result == {8080, 8443}
 
     def test_empty_container_list(self):
         """Empty container list returns empty result."""
         result = _extract_container_ports([])
-        assert result == []
+        assert result == set()
 
     def test_skip_container_with_only_private_port(self):
         """Container with only PrivatePort (no PublicPort key) is skipped."""
@@ -85,7 +85,7 @@ class TestExtractContainerPorts:
             }
         ]
         result = _extract_container_ports(containers)
-        assert result == []
+        assert result == set()
 
 
 @pytest.mark.light
@@ -118,30 +118,30 @@ class TestExtractServicePorts:
             }
         ]
         result = _extract_service_ports(services)
-        assert result == [8080, 8443]
+        assert result == {8080, 8443}
 
     def test_skip_service_without_endpoint(self):
         """Service with no Endpoint key is skipped."""
         services = [{"ID": "svc123", "Spec": {"Name": "web"}}]
         result = _extract_service_ports(services)
-        assert result == []
+        assert result == set()
 
     def test_skip_service_with_endpoint_but_no_spec(self):
         """Service with Endpoint but no Spec is skipped."""
         services = [{"ID": "svc123", "Endpoint": {"VirtualIPs": []}}]
         result = _extract_service_ports(services)
-        assert result == []
+        assert result == set()
 
     def test_skip_service_with_spec_but_no_ports(self):
         """Service with Spec but no Ports key is skipped."""
         services = [{"ID": "svc123", "Endpoint": {"Spec": {"Mode": "vip"}}}]
         result = _extract_service_ports(services)
-        assert result == []
+        assert result == set()
 
     def test_empty_service_list(self):
         """Empty service list returns empty result."""
         result = _extract_service_ports([])
-        assert result == []
+        assert result == set()
 
     def test_mixed_services_extracts_only_with_ports(self):
         """Mixed services: some with ports, some without - extracts only from those with ports."""
@@ -180,4 +180,4 @@ class TestExtractServicePorts:
             },
         ]
         result = _extract_service_ports(services)
-        assert result == [8080, 8443]
+        assert result == {8080, 8443}
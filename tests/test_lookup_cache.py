@@ -0,0 +1,152 @@
+"""Tests for the Docker API lookup cache in docker_challenges.functions.general.
+
+These tests verify TTL reuse, per-endpoint keying and (cross-worker) invalidation of
+cached_lookup() without requiring Docker API connectivity.
+"""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from docker_challenges.functions.general import (
+    _lookup_inflight,
+    cached_lookup,
+    clear_lookup_cache,
+)
+
+
+class _Interrupted(BaseException):
+    """Stand-in for gevent.Timeout / GreenletExit, which bypass ``except Exception``."""
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Isolate every test from lookups cached by other tests."""
+    clear_lookup_cache()
+    yield
+    clear_lookup_cache()
+
+
+@pytest.mark.light
+class TestCachedLookup:
+    """Tests for cached_lookup function."""
+
+    def test_second_call_reuses_cached_value(self, mock_docker_config):
+        """A successful lookup is reused instead of calling fetch again."""
+        fetch = MagicMock(return_value=["nginx"])
+
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == ["nginx"]
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == ["nginx"]
+        fetch.assert_called_once()
+
+    def test_falsy_result_is_not_cached(self, mock_docker_config):
+        """Empty results (e.g. Docker unreachable) are retried on the next call."""
+        fetch = MagicMock(side_effect=[[], ["nginx"]])
+
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == []
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == ["nginx"]
+        assert fetch.call_count == 2
+
+    def test_different_hostnames_are_cached_separately(self, mock_docker_config):
+        """Changing the Docker hostname misses the cache."""
+        fetch = MagicMock(side_effect=[["nginx"], ["redis"]])
+
+        cached_lookup(mock_docker_config, "repositories", fetch)
+        mock_docker_config.hostname = "otherhost:2375"
+
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == ["redis"]
+
+    def test_expired_entry_is_refetched(self, mock_docker_config):
+        """Entries older than the TTL are fetched again."""
+        fetch = MagicMock(side_effect=[["nginx"], ["redis"]])
+
+        with patch("docker_challenges.functions.general.time.monotonic", return_value=100.0):
+            cached_lookup(mock_docker_config, "repositories", fetch, ttl=10)
+        with patch("docker_challenges.functions.general.time.monotonic", return_value=111.0):
+            assert cached_lookup(mock_docker_config, "repositories", fetch, ttl=10) == ["redis"]
+
+    def test_clear_lookup_cache_forces_refetch(self, mock_docker_config):
+        """clear_lookup_cache drops every cached entry."""
+        fetch = MagicMock(side_effect=[["nginx"], ["redis"]])
+
+        cached_lookup(mock_docker_config, "repositories", fetch)
+        clear_lookup_cache()
+
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == ["redis"]
+
+    def test_force_refreshes_fresh_entry(self, mock_docker_config):
+        """force=True bypasses a fresh entry and stores the new value."""
+        fetch = MagicMock(side_effect=[["nginx"], ["redis"]])
+
+        cached_lookup(mock_docker_config, "repositories", fetch)
+        assert cached_lookup(mock_docker_config, "repositories", fetch, force=True) == ["redis"]
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == ["redis"]
+
+    def test_generation_change_from_another_worker_misses_cache(self, mock_docker_config):
+        """A generation bumped elsewhere (shared CTFd cache) invalidates local entries."""
+        fetch = MagicMock(side_effect=[["nginx"], ["redis"]])
+
+        with patch("docker_challenges.functions.general.cache.get", return_value="gen-1"):
+            cached_lookup(mock_docker_config, "repositories", fetch)
+        with patch("docker_challenges.functions.general.cache.get", return_value="gen-2"):
+            assert cached_lookup(mock_docker_config, "repositories", fetch) == ["redis"]
+
+    def test_clear_lookup_cache_bumps_shared_generation(self):
+        """Clearing publishes a new generation to CTFd's cache for other workers."""
+        with patch("docker_challenges.functions.general.cache.set") as mock_set:
+            clear_lookup_cache()
+
+        key, generation = mock_set.call_args.args
+        assert key == "docker_challenges:lookup_generation"
+        assert generation
+
+    def test_concurrent_misses_share_one_fetch(self, mock_docker_config):
+        """Callers arriving while a fetch is in flight wait for its result."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return ["nginx"]
+
+        results = []
+        leader = threading.Thread(
+            target=lambda: results.append(cached_lookup(mock_docker_config, "repositories", fetch))
+        )
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(
+            target=lambda: results.append(cached_lookup(mock_docker_config, "repositories", fetch))
+        )
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert results == [["nginx"], ["nginx"]]
+        assert len(calls) == 1
+
+    def test_fetch_error_is_not_cached(self, mock_docker_config):
+        """A failing fetch propagates and the next call fetches again."""
+        fetch = MagicMock(side_effect=[RuntimeError("boom"), ["nginx"]])
+
+        with pytest.raises(RuntimeError):
+            cached_lookup(mock_docker_config, "repositories", fetch)
+
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == ["nginx"]
+
+    def test_base_exception_releases_in_flight_key(self, mock_docker_config):
+        """A BaseException from fetch does not leave the key in flight for later callers."""
+        fetch = MagicMock(side_effect=[_Interrupted(), ["nginx"]])
+
+        with pytest.raises(_Interrupted):
+            cached_lookup(mock_docker_config, "repositories", fetch)
+
+        assert not _lookup_inflight
+        assert cached_lookup(mock_docker_config, "repositories", fetch) == ["nginx"]
@@ -8,6 +8,7 @@ for Docker containers and services while avoiding blocked ports.
 from __future__ import annotations
 
 import random
+from unittest.mock import patch
 
 import pytest
 
@@ -18,7 +19,11 @@ from docker_challenges.functions.services import _assign_service_ports
 # Constants used by the functions under test
 PORT_ASSIGNMENT_MIN = 30000
 PORT_ASSIGNMENT_MAX = 60000
-MAX_PORT_ASSIGNMENT_ATTEMPTS = 100
+
+
+def _host_ports(bindings: dict) -> list[int]:
+    """Extract the assigned host ports from a PortBindings mapping."""
+    return [int(binding[0]["HostPort"]) for binding in bindings.values()]
 
 
 class TestAssignContainerPorts:
@@ -26,79 +31,97 @@ class TestAssignContainerPorts:
 
     @pytest.mark.light
     def test_single_port_returns_one_entry(self):
-        """Single port should return dictionary with one entry."""
-        result = _assign_container_ports(["80/tcp"], [])
-        assert len(result) == 1
-        assert next(iter(result.values())) == {}
+        """Single port should return a binding keyed by the needed port."""
+        result = _assign_container_ports(["80/tcp"], set())
+        assert list(result) == ["80/tcp"]
+        assert len(result["80/tcp"]) == 1
 
     @pytest.mark.light
     def test_multiple_ports_returns_correct_count(self):
         """Multiple ports should return correct number of entries."""
         needed_ports = ["80/tcp", "443/tcp", "8080/tcp"]
-        result = _assign_container_ports(needed_ports, [])
-        assert len(result) == len(needed_ports)
+        result = _assign_container_ports(needed_ports, set())
+        assert list(result) == needed_ports
+
+    @pytest.mark.light
+    def test_host_port_is_plain_port_number(self):
+        """HostPort values are bare port numbers, as the Docker API expects."""
+        result = _assign_container_ports(["80/tcp"], set())
+        assert result["80/tcp"][0]["HostPort"].isdigit()
 
     @pytest.mark.light
     def test_assigned_ports_in_valid_range(self):
         """All assigned ports should be within [30000, 60000) range."""
         needed_ports = ["80/tcp", "443/tcp", "8080/tcp", "3000/tcp"]
-        result = _assign_container_ports(needed_ports, [])
+        result = _assign_container_ports(needed_ports, set())
 
-        for port_str in result.keys():
-            port_num = int(port_str.split("/")[0])
+        for port_num in _host_ports(result):
             assert PORT_ASSIGNMENT_MIN <= port_num < PORT_ASSIGNMENT_MAX
 
     @pytest.mark.light
     def test_assigned_ports_avoid_blocked_ports(self):
         """Assigned ports should not overlap with blocked_ports."""
-        blocked = [30000, 30001, 30002, 40000, 50000]
+        blocked = {30000, 30001, 30002, 40000, 50000}
         result = _assign_container_ports(["80/tcp", "443/tcp"], blocked)
 
-        for port_str in result.keys():
-            port_num = int(port_str.split("/")[0])
+        for port_num in _host_ports(result):
             assert port_num not in blocked
 
     @pytest.mark.light
     def test_empty_needed_ports_returns_empty_dict(self):
         """Empty needed_ports should return empty dictionary."""
-        result = _assign_container_ports([], [30000, 30001])
+        result = _assign_container_ports([], {30000, 30001})
         assert result == {}
 
     @pytest.mark.light
     def test_port_exhaustion_raises_runtime_error(self):
         """Port exhaustion should raise RuntimeError."""
         # Block the entire range to force exhaustion
-        blocked = list(range(PORT_ASSIGNMENT_MIN, PORT_ASSIGNMENT_MAX))
+        blocked = set(range(PORT_ASSIGNMENT_MIN, PORT_ASSIGNMENT_MAX))
 
-        with pytest.raises(
-            RuntimeError,
-            match=f"Failed to find available port after {MAX_PORT_ASSIGNMENT_ATTEMPTS} attempts",
-        ):
+        with pytest.raises(RuntimeError, match="Not enough free ports: 1 needed, 0 available"):
             _assign_container_ports(["80/tcp"], blocked)
 
+    @pytest.mark.light
+    def test_last_free_port_is_found_when_probing_fails(self):
+        """A nearly exhausted range still yields its remaining free port."""
+        blocked = {p for p in range(PORT_ASSIGNMENT_MIN, PORT_ASSIGNMENT_MAX) if p != 45678}
+
+        result = _assign_container_ports(["80/tcp"], blocked)
+
+        assert result == {"80/tcp": [{"HostPort": "45678"}]}
+
     @pytest.mark.light
     def test_no_blocked_ports_works_fine(self):
         """Function should work correctly with empty blocked_ports list."""
-        result = _assign_container_ports(["80/tcp", "443/tcp"], [])
+        result = _assign_container_ports(["80/tcp", "443/tcp"], set())
         assert len(result) == 2
-        for port_str in result.keys():
-            port_num = int(port_str.split("/")[0])
+        for port_num in _host_ports(result):
             assert PORT_ASSIGNMENT_MIN <= port_num < PORT_ASSIGNMENT_MAX
 
     @pytest.mark.light
     def test_deterministic_with_seed(self):
         """Random seed should produce deterministic results."""
         random.seed(42)
-        result1 = _assign_container_ports(["80/tcp", "443/tcp"], [])
+        result1 = _assign_container_ports(["80/tcp", "443/tcp"], set())
 
         random.seed(42)
-        result2 = _assign_container_ports(["80/tcp", "443/tcp"], [])
+        result2 = _assign_container_ports(["80/tcp", "443/tcp"], set())
 
         assert result1 == result2
 
         # Re-randomize to avoid leaking deterministic state to subsequent tests
         random.seed()
 
+    @pytest.mark.light
+    def test_blocked_candidates_are_skipped(self):
+        """Blocked ports in the sampled candidates are dropped; the rest are used in order."""
+        candidates = [31000, 32000, 33000, 34000]
+        with patch("docker_challenges.functions.general.random.sample", return_value=candidates):
+            result = _assign_container_ports(["80/tcp", "443/tcp"], {31000})
+
+        assert result == {"80/tcp": [{"HostPort": "32000"}], "443/tcp": [{"HostPort": "33000"}]}
+
 
 class TestAssignServicePorts:
     """Tests for _assign_service_ports function."""
@@ -106,7 +129,7 @@ class TestAssignServicePorts:
     @pytest.mark.light
     def test_single_port_returns_one_entry(self):
         """Single port should return list with one entry."""
-        result = _assign_service_ports(["80/tcp"], [])
+        result = _assign_service_ports(["80/tcp"], set())
         assert len(result) == 1
         assert result[0]["TargetPort"] == 80
 
@@ -114,14 +137,14 @@ class TestAssignServicePorts:
     def test_multiple_ports_returns_correct_count(self):
         """Multiple ports should return correct number of entries."""
         needed_ports = ["80/tcp", "443/tcp", "8080/tcp"]
-        result = _assign_service_ports(needed_ports, [])
+        result = _assign_service_ports(needed_ports, set())
         assert len(result) == len(needed_ports)
 
     @pytest.mark.light
     def test_published_ports_in_valid_range(self):
         """All PublishedPort values should be within [30000, 60000) range."""
         needed_ports = ["80/tcp", "443/tcp", "8080/tcp", "3000/tcp"]
-        result = _assign_service_ports(needed_ports, [])
+        result = _assign_service_ports(needed_ports, set())
 
         for port_dict in result:
             assert PORT_ASSIGNMENT_MIN <= port_dict["PublishedPort"] < PORT_ASSIGNMENT_MAX
@@ -129,7 +152,7 @@ class TestAssignServicePorts:
     @pytest.mark.light
     def test_published_ports_avoid_blocked_ports(self):
         """Published ports should not overlap with blocked_ports."""
-        blocked = [30000, 30001, 30002, 40000, 50000]
+        blocked = {30000, 30001, 30002, 40000, 50000}
         result = _assign_service_ports(["80/tcp", "443/tcp"], blocked)
 
         for port_dict in result:
@@ -138,7 +161,7 @@ class TestAssignServicePorts:
     @pytest.mark.light
     def test_each_entry_has_correct_keys(self):
         """Each entry should have all required keys."""
-        result = _assign_service_ports(["80/tcp"], [])
+        result = _assign_service_ports(["80/tcp"], set())
         required_keys = {"PublishedPort", "PublishMode", "Protocol", "TargetPort", "Name"}
 
         assert len(result) == 1
@@ -147,7 +170,7 @@ class TestAssignServicePorts:
     @pytest.mark.light
     def test_publish_mode_is_ingress(self):
         """PublishMode should always be 'ingress'."""
-        result = _assign_service_ports(["80/tcp", "443/tcp"], [])
+        result = _assign_service_ports(["80/tcp", "443/tcp"], set())
 
         for port_dict in result:
             assert port_dict["PublishMode"] == "ingress"
@@ -155,7 +178,7 @@ class TestAssignServicePorts:
     @pytest.mark.light
     def test_protocol_is_tcp(self):
         """Protocol should always be 'tcp'."""
-        result = _assign_service_ports(["80/tcp", "443/tcp"], [])
+        result = _assign_service_ports(["80/tcp", "443/tcp"], set())
 
         for port_dict in result:
             assert port_dict["Protocol"] == "tcp"
@@ -171,25 +194,22 @@ class TestAssignServicePorts:
         ]
 
         for port_spec, expected_target in test_cases:
-            result = _assign_service_ports([port_spec], [])
+            result = _assign_service_ports([port_spec], set())
             assert result[0]["TargetPort"] == expected_target
 
     @pytest.mark.light
     def test_empty_needed_ports_returns_empty_list(self):
         """Empty needed_ports should return empty list."""
-        result = _assign_service_ports([], [30000, 30001])
+        result = _assign_service_ports([], {30000, 30001})
         assert result == []
 
     @pytest.mark.light
     def test_port_exhaustion_raises_runtime_error(self):
         """Port exhaustion should raise RuntimeError."""
         # Block the entire range to force exhaustion
-        blocked = list(range(PORT_ASSIGNMENT_MIN, PORT_ASSIGNMENT_MAX))
+        blocked = set(range(PORT_ASSIGNMENT_MIN, PORT_ASSIGNMENT_MAX))
 
-        with pytest.raises(
-            RuntimeError,
-            match=f"Failed to find available port after {MAX_PORT_ASSIGNMENT_ATTEMPTS} attempts",
-        ):
+        with pytest.raises(RuntimeError, match="Not enough free ports: 1 needed, 0 available"):
             _assign_service_ports(["80/tcp"], blocked)
 
     @pytest.mark.light
@@ -198,6 +218,14 @@ class TestAssignServicePorts:
         test_cases = ["80/tcp", "443/tcp", "8080/tcp"]
 
         for port_spec in test_cases:
-            result = _assign_service_ports([port_spec], [])
+            result = _assign_service_ports([port_spec], set())
             expected_name = f"Exposed Port {port_spec}"
             assert result[0]["Name"] == expected_name
+
+    @pytest.mark.light
+    def test_published_ports_are_distinct(self):
+        """Every endpoint gets its own published port."""
+        result = _assign_service_ports([f"{p}/tcp" for p in range(80, 100)], set())
+
+        published = [entry["PublishedPort"] for entry in result]
+        assert len(set(published)) == len(published) == 20
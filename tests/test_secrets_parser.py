@@ -5,7 +5,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from docker_challenges.functions.services import _build_secrets_list, _parse_docker_secrets
+from docker_challenges.constants import SERVICE_SECRET_LOOKUP_TTL_SECONDS
+from docker_challenges.functions.services import (
+    _build_secrets_list,
+    _parse_docker_secrets,
+    create_service,
+)
 
 
 class TestParseDockerSecrets:
@@ -55,24 +60,13 @@ class TestParseDockerSecrets:
 class TestBuildSecretsList:
     """Tests for _build_secrets_list() with per-secret permissions."""
 
-    def _make_challenge(self, docker_secrets_json):
-        """Create a mock challenge with the given docker_secrets JSON string."""
-        challenge = MagicMock()
-        challenge.docker_secrets = docker_secrets_json
-        return challenge
-
-    def _make_docker(self):
-        """Create a mock docker config."""
-        return MagicMock()
-
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_protected_secret_gets_0o600(self, mock_get_secrets):
-        mock_get_secrets.return_value = [
+    def test_protected_secret_gets_0o600(self):
+        all_secrets = [
             {"ID": "sec1", "Name": "db_password"},
         ]
-        challenge = self._make_challenge('[{"id": "db_password", "protected": true}]')
+        secret_configs = _parse_docker_secrets('[{"id": "db_password", "protected": true}]')
 
-        result = _build_secrets_list(challenge, self._make_docker())
+        result = _build_secrets_list(secret_configs, all_secrets)
 
         assert len(result) == 1
         assert result[0]["File"]["Mode"] == 0o600
@@ -80,91 +74,84 @@ class TestBuildSecretsList:
         assert result[0]["SecretID"] == "sec1"
         assert result[0]["SecretName"] == "db_password"
 
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_unprotected_secret_gets_0o777(self, mock_get_secrets):
-        mock_get_secrets.return_value = [
+    def test_unprotected_secret_gets_0o777(self):
+        all_secrets = [
             {"ID": "sec2", "Name": "api_config"},
         ]
-        challenge = self._make_challenge('[{"id": "api_config", "protected": false}]')
+        secret_configs = _parse_docker_secrets('[{"id": "api_config", "protected": false}]')
 
-        result = _build_secrets_list(challenge, self._make_docker())
+        result = _build_secrets_list(secret_configs, all_secrets)
 
         assert len(result) == 1
         assert result[0]["File"]["Mode"] == 0o777
 
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_mixed_permissions(self, mock_get_secrets):
-        mock_get_secrets.return_value = [
+    def test_mixed_permissions(self):
+        all_secrets = [
             {"ID": "sec1", "Name": "db_password"},
             {"ID": "sec2", "Name": "api_config"},
         ]
-        challenge = self._make_challenge(
+        secret_configs = _parse_docker_secrets(
             '[{"id": "db_password", "protected": true}, {"id": "api_config", "protected": false}]'
         )
 
-        result = _build_secrets_list(challenge, self._make_docker())
+        result = _build_secrets_list(secret_configs, all_secrets)
 
         assert len(result) == 2
         assert result[0]["File"]["Mode"] == 0o600
         assert result[1]["File"]["Mode"] == 0o777
 
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_empty_secrets_returns_empty_list(self, mock_get_secrets):
-        mock_get_secrets.return_value = [
+    def test_empty_secrets_returns_empty_list(self):
+        all_secrets = [
             {"ID": "sec1", "Name": "db_password"},
         ]
-        challenge = self._make_challenge("[]")
+        secret_configs = _parse_docker_secrets("[]")
 
-        result = _build_secrets_list(challenge, self._make_docker())
+        result = _build_secrets_list(secret_configs, all_secrets)
 
         assert result == []
 
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_secret_id_not_found_in_docker_is_skipped(self, mock_get_secrets):
-        mock_get_secrets.return_value = [
+    def test_secret_id_not_found_in_docker_is_skipped(self):
+        all_secrets = [
             {"ID": "sec1", "Name": "db_password"},
         ]
-        challenge = self._make_challenge('[{"id": "nonexistent", "protected": true}]')
+        secret_configs = _parse_docker_secrets('[{"id": "nonexistent", "protected": true}]')
 
-        result = _build_secrets_list(challenge, self._make_docker())
+        result = _build_secrets_list(secret_configs, all_secrets)
 
         assert result == []
 
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_missing_protected_defaults_to_false(self, mock_get_secrets):
-        mock_get_secrets.return_value = [
+    def test_missing_protected_defaults_to_false(self):
+        all_secrets = [
             {"ID": "sec1", "Name": "db_password"},
         ]
-        challenge = self._make_challenge('[{"id": "db_password"}]')
+        secret_configs = _parse_docker_secrets('[{"id": "db_password"}]')
 
-        result = _build_secrets_list(challenge, self._make_docker())
+        result = _build_secrets_list(secret_configs, all_secrets)
 
         assert len(result) == 1
         assert result[0]["File"]["Mode"] == 0o777
 
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_file_uid_gid_are_set(self, mock_get_secrets):
-        mock_get_secrets.return_value = [
+    def test_file_uid_gid_are_set(self):
+        all_secrets = [
             {"ID": "sec1", "Name": "test_secret"},
         ]
-        challenge = self._make_challenge('[{"id": "test_secret", "protected": false}]')
+        secret_configs = _parse_docker_secrets('[{"id": "test_secret", "protected": false}]')
 
-        result = _build_secrets_list(challenge, self._make_docker())
+        result = _build_secrets_list(secret_configs, all_secrets)
 
         assert result[0]["File"]["UID"] == "1"
         assert result[0]["File"]["GID"] == "1"
 
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_legacy_swarm_id_matches_by_fallback(self, mock_get_secrets):
+    def test_legacy_swarm_id_matches_by_fallback(self):
         """Old DB entries storing Swarm IDs still match via ID fallback, with a warning logged."""
-        mock_get_secrets.return_value = [
+        all_secrets = [
             {"ID": "abc123swarmid", "Name": "db_password"},
         ]
         # Stored value is the Swarm ID (legacy format)
-        challenge = self._make_challenge('[{"id": "abc123swarmid", "protected": false}]')
+        secret_configs = _parse_docker_secrets('[{"id": "abc123swarmid", "protected": false}]')
 
         with patch("docker_challenges.functions.services.logging") as mock_log:
-            result = _build_secrets_list(challenge, self._make_docker())
+            result = _build_secrets_list(secret_configs, all_secrets)
 
         assert len(result) == 1
         assert result[0]["SecretID"] == "abc123swarmid"
@@ -173,18 +160,94 @@ class TestBuildSecretsList:
         warning_msg = mock_log.warning.call_args[0][0]
         assert "legacy" in warning_msg.lower() or "swarm id" in warning_msg.lower()
 
-    @patch("docker_challenges.functions.services.get_secrets")
-    def test_missing_secret_logs_warning(self, mock_get_secrets):
+    def test_name_match_wins_over_legacy_id_match(self):
+        """A stored value matching one secret's Name and another's ID resolves by Name."""
+        all_secrets = [
+            {"ID": "shared", "Name": "older_secret"},
+            {"ID": "sec2", "Name": "shared"},
+        ]
+        secret_configs = _parse_docker_secrets('[{"id": "shared"}]')
+
+        result = _build_secrets_list(secret_configs, all_secrets)
+
+        assert [s["SecretID"] for s in result] == ["sec2"]
+
+    def test_missing_secret_logs_warning(self):
         """A configured secret that doesn't exist in Docker is skipped with a warning."""
-        mock_get_secrets.return_value = [
+        all_secrets = [
             {"ID": "sec1", "Name": "existing_secret"},
         ]
-        challenge = self._make_challenge('[{"id": "ghost_secret", "protected": true}]')
+        secret_configs = _parse_docker_secrets('[{"id": "ghost_secret", "protected": true}]')
 
         with patch("docker_challenges.functions.services.logging") as mock_log:
-            result = _build_secrets_list(challenge, self._make_docker())
+            result = _build_secrets_list(secret_configs, all_secrets)
 
         assert result == []
         mock_log.warning.assert_called_once()
         warning_msg = mock_log.warning.call_args[0][0]
         assert "not found" in warning_msg.lower() or "skipping" in warning_msg.lower()
+
+
+class TestCreateServiceSecrets:
+    """Tests for the secrets lookup in create_service()."""
+
+    @staticmethod
+    def _run(docker_secrets_json, mock_get_secrets, docker=None):
+        challenge = MagicMock(exposed_ports="80/tcp", docker_secrets=docker_secrets_json)
+        response = MagicMock()
+        response.json.return_value = {"ID": "svc1"}
+        with (
+            patch("docker_challenges.models.models.DockerServiceChallenge") as mock_model,
+            patch(
+                "docker_challenges.functions.services.get_required_ports",
+                return_value=["80/tcp"],
+            ),
+            patch("docker_challenges.functions.services.do_request", return_value=response),
+        ):
+            mock_model.query.filter_by.return_value.first.return_value = challenge
+            return create_service(docker or MagicMock(), 1, "nginx:latest", "team1", set())
+
+    @patch("docker_challenges.functions.services.get_secrets")
+    def test_challenge_without_secrets_skips_lookup(self, mock_get_secrets):
+        """No /secrets request is made when the challenge has no secrets configured."""
+        instance_id, payload = self._run("[]", mock_get_secrets)
+
+        assert instance_id == "svc1"
+        assert payload["TaskTemplate"]["ContainerSpec"]["Secrets"] == []
+        mock_get_secrets.assert_not_called()
+
+    @patch("docker_challenges.functions.services.get_secrets")
+    def test_configured_secrets_are_mounted(self, mock_get_secrets):
+        """Configured secrets are looked up and mounted into the service."""
+        mock_get_secrets.return_value = [{"ID": "sec1", "Name": "db_password"}]
+
+        _instance_id, payload = self._run('[{"id": "db_password"}]', mock_get_secrets)
+
+        secrets = payload["TaskTemplate"]["ContainerSpec"]["Secrets"]
+        assert [s["SecretID"] for s in secrets] == ["sec1"]
+        mock_get_secrets.assert_called_once()
+
+    @patch("docker_challenges.functions.services.get_secrets")
+    def test_secrets_lookup_expires_after_short_ttl(self, mock_get_secrets):
+        """Secrets changed outside the plugin are seen once the short deploy TTL passes."""
+        mock_get_secrets.return_value = [{"ID": "sec1", "Name": "db_password"}]
+        docker = MagicMock()
+
+        with patch("docker_challenges.functions.general.time.monotonic") as mock_now:
+            mock_now.return_value = 1000.0
+            self._run('[{"id": "db_password"}]', mock_get_secrets, docker)
+            mock_now.return_value = 1000.0 + SERVICE_SECRET_LOOKUP_TTL_SECONDS
+            self._run('[{"id": "db_password"}]', mock_get_secrets, docker)
+
+        assert mock_get_secrets.call_count == 2
+
+    @patch("docker_challenges.functions.services.get_secrets")
+    def test_secrets_lookup_is_cached_between_services(self, mock_get_secrets):
+        """Repeated service creations reuse the cached swarm secrets list."""
+        mock_get_secrets.return_value = [{"ID": "sec1", "Name": "db_password"}]
+        docker = MagicMock()
+
+        self._run('[{"id": "db_password"}]', mock_get_secrets, docker)
+        self._run('[{"id": "db_password"}]', mock_get_secrets, docker)
+
+        mock_get_secrets.assert_called_once()